@@ -7,6 +7,7 @@
 
 """Here we collect a set of datetime wrappers and adaptors to be easily replaced during testing and debugging."""
 
+import time
 from datetime import datetime
 
 import pytz
@@ -14,3 +15,7 @@ import pytz
 
 def get_datetime_now() -> datetime:
     return datetime.now(pytz.UTC)
+
+
+def sleep(seconds: float) -> None:
+    time.sleep(seconds)
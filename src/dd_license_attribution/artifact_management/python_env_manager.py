@@ -11,7 +11,6 @@ from datetime import datetime
 import pytz
 
 from dd_license_attribution.adaptors.os import (
-    change_directory,
     list_dir,
     output_from_command,
     path_exists,
@@ -51,14 +50,13 @@ class PythonEnvManager(ArtifactManager):
 
     def _create_python_env(self, resource_path: str, normalized_rsc_path: str) -> str:
         venv_path = f"{self.local_cache_dir}/{self.timestamped_dir}/{normalized_rsc_path}_virtualenv"
-        change_directory(resource_path)
-        if run_command(["python", "-m", "venv", venv_path]) != 0:
+        if run_command(["python", "-m", "venv", venv_path], cwd=resource_path) != 0:
             raise PyEnvRuntimeError("Failed to create Python virtualenv")
         return venv_path
 
     def _install_pip_dependencies(self, resource_path: str, venv_path: str) -> None:
-        change_directory(resource_path)
-        if run_command([f"{venv_path}/bin/python", "-m", "pip", "install", "."]) != 0:
+        pip_install_args = [f"{venv_path}/bin/python", "-m", "pip", "install", "."]
+        if run_command(pip_install_args, cwd=resource_path) != 0:
             raise PyEnvRuntimeError(
                 "Failed to install dependencies when creating Python virtualenv cache"
             )
@@ -9,6 +9,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from random import uniform
 from typing import Any
 
 # Get application-specific logger
@@ -18,6 +19,7 @@ import pytz
 from agithub.GitHub import GitHub
 from giturlparse import parse as parse_git_url
 
+from dd_license_attribution.adaptors.datetime import sleep
 from dd_license_attribution.adaptors.os import (
     create_dirs,
     list_dir,
@@ -30,6 +32,46 @@ from dd_license_attribution.artifact_management.artifact_manager import (
     SourceCodeReference,
 )
 
+# Retry policy for GitHub secondary rate limits (HTTP 429, or 403 with a
+# "secondary rate limit" message). Primary rate limits are handled by agithub.
+GITHUB_RATE_LIMIT_MAX_RETRIES = 5
+GITHUB_RATE_LIMIT_BASE_BACKOFF = 1.0
+GITHUB_RATE_LIMIT_MAX_BACKOFF = 30.0
+
+
+def is_secondary_rate_limited(status: int, result: Any) -> bool:
+    if status == 429:
+        return True
+    if status != 403 or not isinstance(result, dict):
+        return False
+    message = str(result.get("message", "")).lower()
+    return "secondary rate limit" in message or "abuse" in message
+
+
+def get_with_backoff(endpoint: Any) -> tuple[int, Any]:
+    """Call ``endpoint.get()`` retrying on GitHub secondary rate limits.
+
+    Waits grow exponentially (capped at GITHUB_RATE_LIMIT_MAX_BACKOFF) with
+    jitter so that retries from parallel runs do not line up. The last
+    response is returned as is once the retries are exhausted.
+    """
+    status, result = endpoint.get()
+    for attempt in range(GITHUB_RATE_LIMIT_MAX_RETRIES):
+        if not is_secondary_rate_limited(status, result):
+            break
+        backoff = min(
+            GITHUB_RATE_LIMIT_MAX_BACKOFF, GITHUB_RATE_LIMIT_BASE_BACKOFF * 2**attempt
+        )
+        delay = uniform(backoff / 2, backoff)
+        logger.warning(
+            "GitHub secondary rate limit hit (status %s), retrying in %.1f seconds",
+            status,
+            delay,
+        )
+        sleep(delay)
+        status, result = endpoint.get()
+    return status, result
+
 
 class NonAccessibleRepository(Exception):
     """Exception raised when a repository is not accessible."""
@@ -111,6 +153,7 @@ class SourceCodeManager(ArtifactManager):
         self.github_client = github_client
         self._canonical_urls_cache: dict[str, tuple[str, str | None]] = {}
         self._repository_info_cache: dict[str, tuple[int, dict[str, Any] | None]] = {}
+        self._code_reference_cache: dict[str, SourceCodeReference] = {}
         logger.info(
             "SourceCodeManager initialized with %d mirror(s) with %d seconds TTL.",
             len(self.mirrors),
@@ -213,7 +256,7 @@ class SourceCodeManager(ArtifactManager):
             return self._repository_info_cache[cache_key]
 
         logger.debug("Fetching repository info for: %s/%s", owner, repo)
-        status, result = self.github_client.repos[owner][repo].get()
+        status, result = get_with_backoff(self.github_client.repos[owner][repo])
 
         # Handle redirects (301) for renamed/transferred repositories
         if status == 301 and result and "url" in result:
@@ -233,11 +276,19 @@ class SourceCodeManager(ArtifactManager):
                 endpoint = self.github_client
                 for part in path_parts:
                     endpoint = endpoint[part]
-                status, result = endpoint.get()
+                status, result = get_with_backoff(endpoint)
 
-        # Cache the result (including errors) and return
         cached_result = (status, result)
+        if is_secondary_rate_limited(status, result):
+            # Do not cache a transient failure
+            return cached_result
+
+        # Cache the result (including errors) and return
         self._repository_info_cache[cache_key] = cached_result
+        if status == 200 and result and result.get("full_name"):
+            # Also cache under the canonical name, callers resolving the canonical
+            # URL look the repository up again by its new owner/repo
+            self._repository_info_cache.setdefault(result["full_name"], cached_result)
         logger.debug(
             "Cached repository info for %s/%s with status %s", owner, repo, status
         )
@@ -345,6 +396,10 @@ class SourceCodeManager(ArtifactManager):
     ) -> SourceCodeReference | None:
         logger.debug("Getting code for resource URL: %s", resource_url)
 
+        if not force_update and resource_url in self._code_reference_cache:
+            logger.debug("Returning cached code reference for: %s", resource_url)
+            return self._code_reference_cache[resource_url]
+
         original_parsed_url = parse_git_url(resource_url)
         if not original_parsed_url.valid or not original_parsed_url.github:
             return None
@@ -429,12 +484,14 @@ class SourceCodeManager(ArtifactManager):
                         repo,
                         local_branch_path,
                     )
-                    return SourceCodeReference(
+                    cached_reference = SourceCodeReference(
                         repo_url=repository_url,
                         branch=branch,
                         local_root_path=f"{local_branch_path}",
                         local_full_path=f"{local_branch_path}{path}",
                     )
+                    self._code_reference_cache[resource_url] = cached_reference
+                    return cached_reference
         # we need to clone
         local_branch_path = (
             f"{self.local_cache_dir}/{self.timestamped_dir}/{owner}-{repo}/{branch}"
@@ -467,9 +524,11 @@ class SourceCodeManager(ArtifactManager):
             effective_branch,
             local_branch_path,
         )
-        return SourceCodeReference(
+        cloned_reference = SourceCodeReference(
             repo_url=repository_url,
             branch=branch,
             local_root_path=f"{local_branch_path}",
             local_full_path=f"{local_branch_path}{path}",
         )
+        self._code_reference_cache[resource_url] = cloned_reference
+        return cloned_reference
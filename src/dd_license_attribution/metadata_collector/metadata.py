@@ -10,7 +10,9 @@ from dataclasses import dataclass
 
 # Keeping this class short initially, we should eventually getting it closer
 # to the CycloneDX/SPDX standard as we grow the project.
-@dataclass
+# slots=True drops the per-instance __dict__; instances stay mutable because
+# strategies update fields in place.
+@dataclass(slots=True)
 class Metadata:
     """Metadata class to store metadata of a package."""
 
@@ -62,12 +62,14 @@ class GitHubRepositoryMetadataCollectionStrategy(MetadataCollectionStrategy):
                 if status == 200 and repository:
                     if not package.copyright:
                         package.copyright = [repository["owner"]["login"]]
-                    if repository["license"] and not package.license:
+                    repository_license = repository["license"]
+                    if repository_license and not package.license:
                         # get the license information
-                        if repository["license"].get("spdx_id", None) == "NOASSERTION":
+                        spdx_id = repository_license.get("spdx_id", None)
+                        if spdx_id == "NOASSERTION":
                             package.license = []
                         else:
-                            package.license = [repository["license"].get("spdx_id")]
+                            package.license = [spdx_id]
                 else:
                     raise ValueError(
                         f"Failed to get repository information for {owner}/{repo}"
@@ -29,8 +29,13 @@ from dd_license_attribution.artifact_management.source_code_manager import (
     NonAccessibleRepository,
     SourceCodeManager,
     UnauthorizedRepository,
+    get_with_backoff,
 )
 
+# SPDXID prefixes GitHub uses for workflow actions in dependency-graph SBOMs.
+# These are CI dependencies, not shipped code, so they are skipped.
+GITHUB_ACTIONS_SPDXID_PREFIXES = ("SPDXRef-githubactions-",)
+
 
 class GitHubSbomMetadataCollectionStrategy(MetadataCollectionStrategy):
     # constructor
@@ -42,6 +47,9 @@ class GitHubSbomMetadataCollectionStrategy(MetadataCollectionStrategy):
     ) -> None:
         self.client = github_client
         self.source_code_manager = source_code_manager
+        # SBOMs already downloaded in this run, keyed by (owner, repo); packages
+        # from the same repository reuse them instead of downloading again.
+        self._sbom_cache: dict[tuple[str, str], Any] = {}
         self.company_suffixes_sometimes_used_after_commas = (
             string_formatting_config.default_config.preset_company_suffixes
         )
@@ -167,14 +175,15 @@ class GitHubSbomMetadataCollectionStrategy(MetadataCollectionStrategy):
                 )
             if not self.with_transitive_dependencies:
                 before_count = len(packages_in_sbom)
+                # Lowercase the metadata names once; str.startswith accepts the
+                # whole tuple, instead of re-lowering every name per SBOM entry.
+                metadata_name_prefixes = tuple(
+                    m_pkg.name.lower() for m_pkg in metadata if m_pkg.name is not None
+                )
                 filtered_packages = [
                     pkg
                     for pkg in packages_in_sbom
-                    if any(
-                        m_pkg.name is not None
-                        and pkg["name"].lower().startswith(m_pkg.name.lower())
-                        for m_pkg in metadata
-                    )
+                    if pkg["name"].lower().startswith(metadata_name_prefixes)
                 ]
                 packages_in_sbom = filtered_packages
                 after_count = len(packages_in_sbom)
@@ -191,12 +200,26 @@ class GitHubSbomMetadataCollectionStrategy(MetadataCollectionStrategy):
             # Check if this package represents the root project by comparing with canonical formats
             is_root_package = package_index == root_package_index
 
+            # Index packages by name once per SBOM instead of scanning both lists
+            # for every SBOM entry. setdefault keeps the first entry for a name,
+            # matching the order a linear scan would find.
+            metadata_by_name: dict[str, Metadata] = {}
+            for metadata_entry in metadata:
+                if metadata_entry.name is not None:
+                    metadata_by_name.setdefault(metadata_entry.name, metadata_entry)
+            updated_metadata_by_name: dict[str, Metadata] = {}
+            for metadata_entry in updated_metadata:
+                if metadata_entry.name is not None:
+                    updated_metadata_by_name.setdefault(
+                        metadata_entry.name, metadata_entry
+                    )
+
             for sbom_package in packages_in_sbom:
                 pkg_name = sbom_package.get("name", "<no-name>")
                 logger.debug("Processing SBOM package: '%s'", pkg_name)
                 # skipping CI dependencies declared as actions
-                if "SPDXID" in sbom_package and sbom_package["SPDXID"].startswith(
-                    "SPDXRef-githubactions-"
+                if sbom_package.get("SPDXID", "").startswith(
+                    GITHUB_ACTIONS_SPDXID_PREFIXES
                 ):
                     logger.debug(
                         "Skipping CI dependency (GitHub Action) package: '%s'", pkg_name
@@ -204,21 +227,9 @@ class GitHubSbomMetadataCollectionStrategy(MetadataCollectionStrategy):
                     continue
 
                 # search if there is a package with the same name in the metadata and set it in old_package_metadata variable
-                old_package_metadata = next(
-                    (
-                        old_package_metadata
-                        for old_package_metadata in metadata
-                        if old_package_metadata.name == sbom_package["name"]
-                    ),
-                    None,
-                )
-                new_package_metadata = next(
-                    (
-                        new_package_metadata
-                        for new_package_metadata in updated_metadata
-                        if new_package_metadata.name == sbom_package["name"]
-                    ),
-                    None,
+                old_package_metadata = metadata_by_name.get(sbom_package["name"])
+                new_package_metadata = updated_metadata_by_name.get(
+                    sbom_package["name"]
                 )
                 version, origin, license, copyright = None, None, [], []
 
@@ -314,6 +325,8 @@ class GitHubSbomMetadataCollectionStrategy(MetadataCollectionStrategy):
                             )
                         # Add the updated initial package to the output
                         updated_metadata.append(package)
+                        if package.name is not None:
+                            updated_metadata_by_name.setdefault(package.name, package)
                         initial_package_processed = True
                     else:
                         # This is a different package, create new metadata
@@ -329,6 +342,9 @@ class GitHubSbomMetadataCollectionStrategy(MetadataCollectionStrategy):
                             "Created new metadata entry for package '%s'", pkg_name
                         )
                         updated_metadata.append(updated_package)
+                        updated_metadata_by_name.setdefault(
+                            sbom_package["name"], updated_package
+                        )
                         # Check if this is the initial package
                         if updated_package.name == package.name:
                             initial_package_processed = True
@@ -354,12 +370,21 @@ class GitHubSbomMetadataCollectionStrategy(MetadataCollectionStrategy):
         logger.debug(
             "Attempting to retrieve GitHub-generated SBOM for '%s/%s'.", owner, repo
         )
-        status, result = self.client.repos[owner][repo]["dependency-graph"].sbom.get()
+        if (owner, repo) in self._sbom_cache:
+            logger.debug(
+                "Reusing GitHub SBOM already retrieved for '%s/%s'.", owner, repo
+            )
+            return self._sbom_cache[(owner, repo)]
+        status, result = get_with_backoff(
+            self.client.repos[owner][repo]["dependency-graph"].sbom
+        )
         logger.debug(
             "GitHub SBOM API response for '%s/%s': status=%s", owner, repo, status
         )
         if status == 200:
-            return result["sbom"]
+            sbom = result["sbom"]
+            self._sbom_cache[(owner, repo)] = sbom
+            return sbom
         if status == 404:
             error_message = (
                 f"Inexistent repository or private repository and not enough permissions in the GitHub token.\n"
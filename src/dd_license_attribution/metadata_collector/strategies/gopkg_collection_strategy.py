@@ -8,6 +8,7 @@
 import json
 import logging
 import re
+from collections.abc import Iterator
 from typing import Any
 
 from dd_license_attribution.adaptors.os import (
@@ -29,6 +30,31 @@ from dd_license_attribution.metadata_collector.strategies.abstract_collection_st
 
 logger = logging.getLogger("dd_license_attribution")
 
+# Directories the go tool ignores when matching packages (plus any name
+# starting with "." or "_"), and node_modules, which never holds Go modules.
+GO_SKIPPED_DIRECTORIES = frozenset({"testdata", "vendor", "node_modules"})
+
+GO_MOD_MODULE_RE = re.compile(r"^\s*module\s+(\S+)", re.MULTILINE)
+GO_MOD_REQUIRE_RE = re.compile(r"^\s*require\s+(\S+)\s+v[\d\.]+", re.MULTILINE)
+
+
+def _iter_go_list_packages(output: str) -> Iterator[dict[str, Any]]:
+    """Decode the concatenated JSON objects printed by go list -json one at a time.
+
+    Avoids building a rewritten copy of the whole output and a list holding
+    every package record before modules are deduplicated.
+    """
+    decoder = json.JSONDecoder()
+    index = 0
+    end = len(output)
+    while True:
+        while index < end and output[index].isspace():
+            index += 1
+        if index == end:
+            return
+        package_data, index = decoder.raw_decode(output, index)
+        yield package_data
+
 
 class GoPkgMetadataCollectionStrategy(MetadataCollectionStrategy):
     def __init__(
@@ -42,6 +68,7 @@ class GoPkgMetadataCollectionStrategy(MetadataCollectionStrategy):
         self.source_code_manager = source_code_manager
         self.only_root_project = project_scope == ProjectScope.ONLY_ROOT_PROJECT
         self._head_branch_cache: dict[str, str] = {}
+        self._go_list_cache: dict[str, list[dict[str, Any]]] = {}
 
         if local_project_path is not None:
             # In go-package mode, top_package is a Go import path, not a URL
@@ -61,19 +88,27 @@ class GoPkgMetadataCollectionStrategy(MetadataCollectionStrategy):
         # Walk through the directory to find go.mod files
         if not source_code_ref:
             return metadata
-        for root, _, files in walk_directory(source_code_ref.local_full_path):
+        metadata_by_name = self._index_metadata_by_name(metadata)
+        for root, dirs, files in walk_directory(source_code_ref.local_full_path):
+            # Prune in place so the walk never descends into these subtrees.
+            dirs[:] = [
+                d
+                for d in dirs
+                if d not in GO_SKIPPED_DIRECTORIES and not d.startswith((".", "_"))
+            ]
             if "go.mod" in files:
                 if self._is_example_package(root):
+                    dirs.clear()
                     continue
                 module_data_list = self._run_go_list_modules(root)
                 for module_data in module_data_list:
                     module_path = module_data["Path"]
 
                     if self.only_root_project:
-                        if not any(meta.name == module_path for meta in metadata):
+                        if module_path not in metadata_by_name:
                             continue
 
-                    self._upsert_metadata(metadata, module_data)
+                    self._upsert_metadata(metadata, metadata_by_name, module_data)
 
         return metadata
 
@@ -111,6 +146,8 @@ class GoPkgMetadataCollectionStrategy(MetadataCollectionStrategy):
         if not module_data_list:
             return metadata
 
+        metadata_by_name = self._index_metadata_by_name(metadata)
+
         for module_data in module_data_list:
             module_path = module_data["Path"]
 
@@ -135,7 +172,7 @@ class GoPkgMetadataCollectionStrategy(MetadataCollectionStrategy):
                 ):
                     continue
 
-            self._upsert_metadata(metadata, module_data)
+            self._upsert_metadata(metadata, metadata_by_name, module_data)
 
         return metadata
 
@@ -144,7 +181,11 @@ class GoPkgMetadataCollectionStrategy(MetadataCollectionStrategy):
 
         Parses package-level output and extracts unique modules from the
         nested Module key, skipping stdlib packages (no Module key).
+        Results are cached per directory so each module is listed only once.
         """
+        if project_path in self._go_list_cache:
+            return self._go_list_cache[project_path]
+
         output = output_from_command(
             ["go", "list", "-json", "all"],
             cwd=project_path,
@@ -152,13 +193,11 @@ class GoPkgMetadataCollectionStrategy(MetadataCollectionStrategy):
         )
         if not output.strip():
             logger.warning("go list produced no output in %s", project_path)
+            self._go_list_cache[project_path] = []
             return []
 
-        corrected_output = "[{}]".format(output.replace("}\n{", "},\n{"))
-        package_data_list: list[dict[str, Any]] = json.loads(corrected_output)
-
         seen_modules: dict[str, dict[str, Any]] = {}
-        for package_data in package_data_list:
+        for package_data in _iter_go_list_packages(output):
             if "Module" not in package_data:
                 continue
             module = package_data["Module"]
@@ -166,35 +205,51 @@ class GoPkgMetadataCollectionStrategy(MetadataCollectionStrategy):
             if module_path not in seen_modules:
                 seen_modules[module_path] = module
 
-        return list(seen_modules.values())
+        modules = list(seen_modules.values())
+        self._go_list_cache[project_path] = modules
+        return modules
+
+    @staticmethod
+    def _index_metadata_by_name(metadata: list[Metadata]) -> dict[str, Metadata]:
+        """Index metadata by name, keeping the first entry for each name."""
+        metadata_by_name: dict[str, Metadata] = {}
+        for meta in metadata:
+            if meta.name is not None:
+                metadata_by_name.setdefault(meta.name, meta)
+        return metadata_by_name
 
     def _upsert_metadata(
-        self, metadata: list[Metadata], module_data: dict[str, Any]
+        self,
+        metadata: list[Metadata],
+        metadata_by_name: dict[str, Metadata],
+        module_data: dict[str, Any],
     ) -> None:
-        """Add or update a metadata entry from a go list module dict."""
+        """Add or update a metadata entry from a go list module dict.
+
+        metadata_by_name must index metadata and is kept in sync on append.
+        """
         module_path = module_data["Path"]
         version = module_data.get("Version")
-
-        module_metadata = Metadata(
+        origin = self._translate_github_path(module_path)
+        local_src_path = module_data.get("Dir") or None
+
+        meta = metadata_by_name.get(module_path)
+        if meta is not None:
+            meta.origin = origin
+            meta.local_src_path = local_src_path
+            if version is not None:
+                meta.version = version
+            return
+        meta = Metadata(
             name=module_path,
-            origin=self._translate_github_path(module_path),
-            local_src_path=module_data.get("Dir") or None,
+            origin=origin,
+            local_src_path=local_src_path,
             license=[],
             version=version,
             copyright=[],
         )
-
-        for i, meta in enumerate(metadata):
-            if meta.name == module_metadata.name:
-                metadata[i].origin = module_metadata.origin
-                metadata[i].local_src_path = module_metadata.local_src_path
-                metadata[i].version = (
-                    module_metadata.version
-                    if module_metadata.version is not None
-                    else metadata[i].version
-                )
-                return
-        metadata.append(module_metadata)
+        metadata.append(meta)
+        metadata_by_name[module_path] = meta
 
     def _translate_github_path(self, path: str) -> str:
         if not path.startswith("github.com"):
@@ -231,26 +286,16 @@ class GoPkgMetadataCollectionStrategy(MetadataCollectionStrategy):
 
     def _is_example_package(self, go_mod_path: str) -> bool:
         # a module is an example, if the name ends with /examples and requires the main module
-        module_name = None
-        requires_main_module = False
-
         file = open_file(f"{go_mod_path}/go.mod")
 
         if not file:
             return False
-        for line in file.splitlines():
-            line = line.strip()
-            module_match = re.match(r"^module\s+(\S+)", line)
-            if module_match:
-                module_name = module_match.group(1)
-            require_match = re.match(r"^require\s+(\S+)\s+v[\d\.]+", line)
-            if require_match:
-                required_module = require_match.group(1)
-                # Check if required module is a parent module
-                if module_name and required_module in module_name:
-                    requires_main_module = True
-
-        # The module name should end with /examples and require the main module
-        return bool(
-            module_name and module_name.endswith("/examples") and requires_main_module
+        module_match = GO_MOD_MODULE_RE.search(file)
+        if not module_match or not module_match.group(1).endswith("/examples"):
+            return False
+        module_name = module_match.group(1)
+        # Check if any required module is a parent module
+        return any(
+            required_module in module_name
+            for required_module in GO_MOD_REQUIRE_RE.findall(file)
         )
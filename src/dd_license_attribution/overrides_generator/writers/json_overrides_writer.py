@@ -5,7 +5,6 @@
 # This product includes software developed at Datadog (https://www.datadoghq.com/).
 # Copyright 2025-present Datadog, Inc.
 
-import io
 import json
 
 from dd_license_attribution.metadata_collector.strategies.override_strategy import (  # noqa: E501
@@ -24,8 +23,6 @@ class JSONOverridesWriter(OverridesWriter):
 
     def write(self, override_rules: list[OverrideRule]) -> str:
         # Convert OverrideRule objects to dictionaries for JSON output
-
-        output = io.StringIO()
         json_rules = [
             {
                 "override_type": rule.override_type.value,
@@ -44,8 +41,4 @@ class JSONOverridesWriter(OverridesWriter):
             for rule in override_rules
         ]
 
-        json.dump(json_rules, output, indent=2)
-        json_string = output.getvalue()
-        output.close()
-
-        return json_string
+        return json.dumps(json_rules, indent=2)
@@ -36,7 +36,7 @@ def github_client() -> GitHub:
 def test_repos_get_returns_expected_structure(github_client: GitHub) -> None:
     """Ensure repos.get() returns expected repository structure.
 
-    We depend on: owner, license, html_url, url fields from the API response.
+    We depend on: owner, license, html_url, url, full_name fields from the API response.
     """
     # Use DataDog/dd-license-attribution as a known public repository
     status, result = github_client.repos["DataDog"]["dd-license-attribution"].get()
@@ -63,6 +63,10 @@ def test_repos_get_returns_expected_structure(github_client: GitHub) -> None:
     assert isinstance(result["html_url"], str), "html_url should be a string"
     assert "url" in result, "Response should contain 'url' field"
     assert isinstance(result["url"], str), "url should be a string"
+    assert "full_name" in result, "Response should contain 'full_name' field"
+    assert (
+        result["full_name"] == "DataDog/dd-license-attribution"
+    ), "full_name should be owner/repo"
 
 
 def test_repos_get_handles_redirects(github_client: GitHub) -> None:
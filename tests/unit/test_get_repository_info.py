@@ -5,7 +5,7 @@
 # This product includes software developed at Datadog (https://www.datadoghq.com/).
 # Copyright 2026-present Datadog, Inc.
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 from dd_license_attribution.artifact_management.source_code_manager import (
     SourceCodeManager,
@@ -147,6 +147,65 @@ def test_get_repository_info_handles_301_redirects(
     list_dir_mock.assert_called_once_with("cache_dir")
 
 
+@patch("dd_license_attribution.artifact_management.artifact_manager.list_dir")
+@patch("dd_license_attribution.artifact_management.artifact_manager.path_exists")
+def test_get_repository_info_caches_redirected_result_under_canonical_name(
+    path_exists_mock: Mock,
+    list_dir_mock: Mock,
+) -> None:
+    """Test that a redirected repository is served from cache when looked up by its canonical owner/repo."""
+    # Configure mocks
+    path_exists_mock.return_value = True
+    list_dir_mock.return_value = []
+
+    final_repo_mock = Mock()
+    final_repo_mock.get.return_value = (
+        200,
+        {
+            "full_name": "DataDog/dd-license-attribution",
+            "html_url": "https://github.com/DataDog/dd-license-attribution",
+            "url": "https://api.github.com/repos/DataDog/dd-license-attribution",
+            "license": {"spdx_id": "Apache-2.0"},
+            "owner": {"login": "DataDog"},
+        },
+    )
+    first_repo_mock = Mock()
+    first_repo_mock.get.return_value = (
+        301,
+        {"url": "https://api.github.com/repos/DataDog/dd-license-attribution"},
+    )
+
+    # repos/DataDog/<repo> returns the redirect for the old name and the final
+    # repository for the new one, on both the attribute and the item access paths
+    def repo_for(name: str) -> Mock:
+        return final_repo_mock if name == "dd-license-attribution" else first_repo_mock
+
+    owner_mock = Mock()
+    owner_mock.__getitem__ = Mock(side_effect=repo_for)
+    repos_mock = Mock()
+    repos_mock.__getitem__ = Mock(return_value=owner_mock)
+    github_client_mock = Mock()
+    github_client_mock.repos = repos_mock
+    github_client_mock.__getitem__ = Mock(return_value=repos_mock)
+
+    source_code_manager = SourceCodeManager("cache_dir", github_client_mock, 86400)
+
+    status, result = source_code_manager.get_repository_info("DataDog", "ospo-tools")
+    canonical_status, canonical_result = source_code_manager.get_repository_info(
+        "DataDog", "dd-license-attribution"
+    )
+
+    assert status == canonical_status == 200
+    assert canonical_result is result
+
+    # The canonical lookup did not trigger a second fetch of the same repository
+    first_repo_mock.get.assert_called_once_with()
+    final_repo_mock.get.assert_called_once_with()
+    github_client_mock.__getitem__.assert_called_once_with("repos")
+    path_exists_mock.assert_called_once_with("cache_dir")
+    list_dir_mock.assert_called_once_with("cache_dir")
+
+
 @patch("dd_license_attribution.artifact_management.artifact_manager.list_dir")
 @patch("dd_license_attribution.artifact_management.artifact_manager.path_exists")
 def test_get_repository_info_caches_error_responses(
@@ -313,3 +372,193 @@ def test_get_repository_info_then_get_canonical_urls_reuses_cache(
     )
     path_exists_mock.assert_called_once_with("cache_dir")
     list_dir_mock.assert_called_once_with("cache_dir")
+
+
+@patch("dd_license_attribution.artifact_management.source_code_manager.parse_git_url")
+@patch("dd_license_attribution.artifact_management.artifact_manager.list_dir")
+@patch("dd_license_attribution.artifact_management.artifact_manager.path_exists")
+def test_get_canonical_urls_reuses_cached_not_found_for_other_url_spellings(
+    path_exists_mock: Mock,
+    list_dir_mock: Mock,
+    git_url_parse_mock: Mock,
+) -> None:
+    """Test that a 404 is fetched once even when the same repository is referenced by different URLs."""
+    # Configure mocks
+    path_exists_mock.return_value = True
+    list_dir_mock.return_value = []
+
+    git_url_parse_mock.return_value.valid = True
+    git_url_parse_mock.return_value.github = True
+    git_url_parse_mock.return_value.owner = "DataDog"
+    git_url_parse_mock.return_value.repo = "deleted-repo"
+    git_url_parse_mock.return_value.protocol = "https"
+    git_url_parse_mock.return_value.host = "github.com"
+
+    # Mock GitHub API client to return 404
+    github_client_mock = Mock()
+    repo_mock = Mock()
+    repo_mock.get.return_value = (404, None)
+    owner_mock = Mock()
+    owner_mock.__getitem__ = Mock(return_value=repo_mock)
+    repos_mock = Mock()
+    repos_mock.__getitem__ = Mock(return_value=owner_mock)
+    github_client_mock.repos = repos_mock
+
+    source_code_manager = SourceCodeManager("cache_dir", github_client_mock, 86400)
+
+    first = source_code_manager.get_canonical_urls(
+        "https://github.com/DataDog/deleted-repo"
+    )
+    second = source_code_manager.get_canonical_urls(
+        "https://github.com/DataDog/deleted-repo.git"
+    )
+
+    assert first == second == ("https://github.com/DataDog/deleted-repo", None)
+
+    # Both URLs are parsed, but the missing repository is only requested once
+    git_url_parse_mock.assert_has_calls(
+        [
+            call("https://github.com/DataDog/deleted-repo"),
+            call("https://github.com/DataDog/deleted-repo.git"),
+        ]
+    )
+    repo_mock.get.assert_called_once_with()
+    path_exists_mock.assert_called_once_with("cache_dir")
+    list_dir_mock.assert_called_once_with("cache_dir")
+
+
+@patch("dd_license_attribution.artifact_management.source_code_manager.uniform")
+@patch("dd_license_attribution.artifact_management.source_code_manager.sleep")
+@patch("dd_license_attribution.artifact_management.artifact_manager.list_dir")
+@patch("dd_license_attribution.artifact_management.artifact_manager.path_exists")
+def test_get_repository_info_retries_on_secondary_rate_limit(
+    path_exists_mock: Mock,
+    list_dir_mock: Mock,
+    sleep_mock: Mock,
+    uniform_mock: Mock,
+) -> None:
+    """Test that get_repository_info backs off and retries when GitHub reports a secondary rate limit."""
+    # Configure mocks
+    path_exists_mock.return_value = True
+    list_dir_mock.return_value = []
+    uniform_mock.side_effect = lambda low, high: high
+
+    repository = {
+        "html_url": "https://github.com/DataDog/dd-license-attribution",
+        "url": "https://api.github.com/repos/DataDog/dd-license-attribution",
+    }
+    github_client_mock = Mock()
+    repo_mock = Mock()
+    repo_mock.get.side_effect = [
+        (429, {"message": "Too Many Requests"}),
+        (403, {"message": "You have exceeded a secondary rate limit."}),
+        (200, repository),
+    ]
+    owner_mock = Mock()
+    owner_mock.__getitem__ = Mock(return_value=repo_mock)
+    repos_mock = Mock()
+    repos_mock.__getitem__ = Mock(return_value=owner_mock)
+    github_client_mock.repos = repos_mock
+
+    source_code_manager = SourceCodeManager("cache_dir", github_client_mock, 86400)
+
+    status, result = source_code_manager.get_repository_info(
+        "DataDog", "dd-license-attribution"
+    )
+
+    assert status == 200
+    assert result == repository
+
+    # Two rate limited responses, each followed by a growing backoff
+    repo_mock.get.assert_has_calls([call(), call(), call()])
+    assert repo_mock.get.call_count == 3
+    uniform_mock.assert_has_calls([call(0.5, 1.0), call(1.0, 2.0)])
+    sleep_mock.assert_has_calls([call(1.0), call(2.0)])
+    assert sleep_mock.call_count == 2
+    path_exists_mock.assert_called_once_with("cache_dir")
+    list_dir_mock.assert_called_once_with("cache_dir")
+
+
+@patch("dd_license_attribution.artifact_management.source_code_manager.uniform")
+@patch("dd_license_attribution.artifact_management.source_code_manager.sleep")
+@patch("dd_license_attribution.artifact_management.artifact_manager.list_dir")
+@patch("dd_license_attribution.artifact_management.artifact_manager.path_exists")
+def test_get_repository_info_does_not_cache_exhausted_secondary_rate_limit(
+    path_exists_mock: Mock,
+    list_dir_mock: Mock,
+    sleep_mock: Mock,
+    uniform_mock: Mock,
+) -> None:
+    """Test that a secondary rate limit outliving the retries is returned but not cached."""
+    # Configure mocks
+    path_exists_mock.return_value = True
+    list_dir_mock.return_value = []
+    uniform_mock.side_effect = lambda low, high: high
+
+    github_client_mock = Mock()
+    repo_mock = Mock()
+    repo_mock.get.return_value = (429, {"message": "Too Many Requests"})
+    owner_mock = Mock()
+    owner_mock.__getitem__ = Mock(return_value=repo_mock)
+    repos_mock = Mock()
+    repos_mock.__getitem__ = Mock(return_value=owner_mock)
+    github_client_mock.repos = repos_mock
+
+    source_code_manager = SourceCodeManager("cache_dir", github_client_mock, 86400)
+
+    status, _ = source_code_manager.get_repository_info(
+        "DataDog", "dd-license-attribution"
+    )
+    assert status == 429
+
+    # Initial request plus 5 retries, backoff capped at 30 seconds
+    assert repo_mock.get.call_count == 6
+    sleep_mock.assert_has_calls(
+        [call(1.0), call(2.0), call(4.0), call(8.0), call(16.0)]
+    )
+    assert sleep_mock.call_count == 5
+
+    # The failure was not cached, the next lookup asks GitHub again
+    repo_mock.get.reset_mock()
+    repo_mock.get.return_value = (200, {"html_url": "https://github.com/x/y"})
+    status, _ = source_code_manager.get_repository_info(
+        "DataDog", "dd-license-attribution"
+    )
+    assert status == 200
+    repo_mock.get.assert_called_once_with()
+    path_exists_mock.assert_called_once_with("cache_dir")
+    list_dir_mock.assert_called_once_with("cache_dir")
+
+
+@patch("dd_license_attribution.artifact_management.source_code_manager.sleep")
+@patch("dd_license_attribution.artifact_management.artifact_manager.list_dir")
+@patch("dd_license_attribution.artifact_management.artifact_manager.path_exists")
+def test_get_repository_info_does_not_retry_plain_forbidden(
+    path_exists_mock: Mock,
+    list_dir_mock: Mock,
+    sleep_mock: Mock,
+) -> None:
+    """Test that a 403 unrelated to rate limiting is returned without retrying."""
+    # Configure mocks
+    path_exists_mock.return_value = True
+    list_dir_mock.return_value = []
+
+    github_client_mock = Mock()
+    repo_mock = Mock()
+    repo_mock.get.return_value = (403, {"message": "Resource not accessible"})
+    owner_mock = Mock()
+    owner_mock.__getitem__ = Mock(return_value=repo_mock)
+    repos_mock = Mock()
+    repos_mock.__getitem__ = Mock(return_value=owner_mock)
+    github_client_mock.repos = repos_mock
+
+    source_code_manager = SourceCodeManager("cache_dir", github_client_mock, 86400)
+
+    status, result = source_code_manager.get_repository_info("DataDog", "private-repo")
+
+    assert status == 403
+    assert result == {"message": "Resource not accessible"}
+    repo_mock.get.assert_called_once_with()
+    sleep_mock.assert_not_called()
+    path_exists_mock.assert_called_once_with("cache_dir")
+    list_dir_mock.assert_called_once_with("cache_dir")
@@ -5,10 +5,22 @@
 # This product includes software developed at Datadog (https://www.datadoghq.com/).
 # Copyright 2024-present Datadog, Inc.
 
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
 import pytest_mock
-from agithub.GitHub import GitHub
 
+from dd_license_attribution.artifact_management.source_code_manager import (
+    SourceCodeManager,
+)
 from dd_license_attribution.metadata_collector.metadata import Metadata
+from dd_license_attribution.metadata_collector.strategies import (
+    github_sbom_collection_strategy,
+)
 from dd_license_attribution.metadata_collector.strategies.cleanup_copyright_metadata_strategy import (
     CleanupCopyrightMetadataStrategy,
 )
@@ -18,229 +30,359 @@ from dd_license_attribution.metadata_collector.strategies.github_sbom_collection
 )
 
 
+@dataclass(frozen=True, slots=True)
 class GitUrlParseMock:
-    def __init__(
-        self, valid: bool, platform: str, owner: str | None, repo: str | None
-    ) -> None:
-        self.valid = valid
-        self.platform = platform
-        self.owner = owner
-        self.repo = repo
-        self.github = platform == "github"
+    valid: bool = True
+    platform: str = "github"
+    owner: str | None = "test_owner"
+    repo: str | None = "test_repo"
+
+    @property
+    def github(self) -> bool:
+        return self.platform == "github"
+
+
+# Parse results are frozen, so one instance per repository can be shared by
+# every test.
+_DEFAULT_PARSE = GitUrlParseMock()
+_HYPHENATED_PARSE = GitUrlParseMock(owner="test-owner", repo="test-repo")
+
+
+# SBOM responses shared by tests; the strategy only reads them.
+_REPEATED_PACKAGE_SBOM_RESPONSE = (
+    200,
+    {
+        "sbom": {
+            "packages": [
+                {
+                    "SPDXID": "SPDXRef-githubactions-somthing-that-acts"
+                },  # this should be skipped
+                {  # this is the package from the original metadata with new information
+                    "name": "package1",
+                    "versionInfo": "2.0",
+                    "licenseDeclared": "APACHE-2.0",
+                    "downloadLocation": "test_purl",
+                },
+                {  # this was already in the previous line, we keep the new information and not override with this.
+                    "name": "package1"
+                },
+                {  # this is a package that is not in the original metadata and has downloadLocation declared
+                    "name": "package3",
+                    "versionInfo": "3.0",
+                    "licenseDeclared": "APACHE-2.0",
+                    "downloadLocation": "test_purl_2",
+                },
+            ]
+        }
+    },
+)
 
 
-def test_github_sbom_collection_strategy_returns_same_metadata_if_not_a_github_repo(
-    mocker: pytest_mock.MockFixture,
-) -> None:
-    github_client_mock = mocker.Mock(spec_set=GitHub)
-    source_code_manager_mock = mocker.Mock()
-    source_code_manager_mock.get_canonical_urls.return_value = (
-        "not_a_github_purl",
-        None,
-    )
+_TWO_PACKAGE_SBOM_RESPONSE = (
+    200,
+    {
+        "sbom": {
+            "packages": [
+                {
+                    "name": "package1",
+                    "versionInfo": "2.0",
+                    "licenseDeclared": "APACHE-2.0",
+                    "downloadLocation": "test_purl",
+                },
+                {
+                    "name": "package2",
+                    "versionInfo": "3.0",
+                    "licenseDeclared": "APACHE-2.0",
+                    "downloadLocation": "test_purl_2",
+                },
+            ]
+        }
+    },
+)
 
-    github_parse_mock = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.github_sbom_collection_strategy.parse_git_url",
-        return_value=GitUrlParseMock(
-            valid=True,
-            platform="not_github",
-            owner=None,
-            repo=None,
-        ),
-    )
 
-    strategy = GitHubSbomMetadataCollectionStrategy(
-        github_client=github_client_mock,
-        source_code_manager=source_code_manager_mock,
-        project_scope=ProjectScope.ALL,
-    )
+_ROOT_AND_DEPENDENCY_SBOM_RESPONSE = (
+    200,
+    {
+        "sbom": {
+            "packages": [
+                {
+                    "name": "com.github.test_owner/test_repo",
+                    "versionInfo": "2.0",
+                    "licenseDeclared": "APACHE-2.0",
+                    "downloadLocation": "test_purl",
+                },
+                {
+                    "name": "package2",
+                    "versionInfo": "3.0",
+                    "licenseDeclared": "APACHE-2.0",
+                    "downloadLocation": "test_purl_2",
+                },
+            ]
+        }
+    },
+)
 
-    initial_metadata = [
-        Metadata(
-            name="",
-            version="",
-            origin="not_a_github_purl",
-            local_src_path="",
-            license=[],
-            copyright=[],
-        )
-    ]
 
-    updated_metadata = strategy.augment_metadata(initial_metadata)
-    assert updated_metadata == initial_metadata
+_NAME_AS_ORIGIN_SBOM_RESPONSE = (
+    200,
+    {
+        "sbom": {
+            "packages": [
+                {
+                    "name": "package0",
+                    "versionInfo": "4.0",
+                    "licenseDeclared": "MIT",
+                    "copyrightText": "Copyright 1",
+                    "downloadLocation": "test_purl",
+                },
+                {
+                    "name": "github.com/package1",
+                    "versionInfo": "2.0",
+                    "licenseConcluded": "MIT",
+                    "copyrightText": "Copyright 2",
+                    "downloadLocation": "",
+                },
+                {
+                    "name": "github.com/package2",
+                    "versionInfo": "3.0",
+                    "licenseConcluded": "MIT",
+                    "copyrightText": "Copyright 3",
+                    "downloadLocation": "NOASSERTION",
+                },
+            ]
+        }
+    },
+)
 
-    source_code_manager_mock.get_canonical_urls.assert_called_once_with(
-        "not_a_github_purl"
-    )
 
+# Expected results are only compared against, never passed to a strategy, so
+# they can be built once per module.
+_EXPECTED_REPEATED_PACKAGE_METADATA = [
+    Metadata(
+        name="package1",
+        version="2.0",
+        origin="https://github.com/test_owner/test_repo",
+        local_src_path=None,
+        license=["APACHE-2.0"],
+        copyright=[],
+    ),
+    Metadata(
+        name="package2",
+        version=None,
+        origin=None,
+        local_src_path=None,
+        license=[],
+        copyright=[],
+    ),
+    Metadata(
+        name="package3",
+        version="3.0",
+        origin="test_purl_2",
+        local_src_path=None,
+        license=["APACHE-2.0"],
+        copyright=[],
+    ),
+]
+
+
+_EXPECTED_NAME_AS_ORIGIN_METADATA = [
+    Metadata(
+        name="package0",
+        version="4.0",
+        origin="https://github.com/test_owner/test_repo",
+        local_src_path=None,
+        license=["MIT"],
+        copyright=["Copyright 1"],
+    ),
+    Metadata(
+        name="github.com/package1",
+        version="2.0",
+        origin="https://github.com/package1",
+        local_src_path=None,
+        license=["MIT"],
+        copyright=["Copyright 2"],
+    ),
+    Metadata(
+        name="github.com/package2",
+        version="3.0",
+        origin="https://github.com/package2",
+        local_src_path=None,
+        license=["MIT"],
+        copyright=["Copyright 3"],
+    ),
+]
+
+
+def empty_metadata(origin: str) -> Metadata:
+    """Build a fresh, otherwise empty Metadata entry; the strategy mutates it."""
+    return Metadata(
+        name="",
+        version="",
+        origin=origin,
+        local_src_path="",
+        license=[],
+        copyright=[],
+    )
+
+
+MetadataKey = tuple[
+    str | None, str | None, str | None, str | None, tuple[str, ...], tuple[str, ...]
+]
+
+
+def metadata_key(metadata: Metadata) -> MetadataKey:
+    """Hashable view of every Metadata field, for order-insensitive comparison."""
+    return (
+        metadata.name,
+        metadata.version,
+        metadata.origin,
+        metadata.local_src_path,
+        tuple(metadata.license),
+        tuple(metadata.copyright),
+    )
+
+
+def assert_sbom_fetched_once(
+    source_code_manager_mock: pytest_mock.MockType,
+    github_parse_mock: pytest_mock.MockType,
+    sbom_mock: pytest_mock.MockType,
+    purl: str = "test_purl",
+    repository_url: str = "https://github.com/test_owner/test_repo",
+) -> None:
+    """Check the single package was resolved, parsed and its SBOM fetched once."""
+    source_code_manager_mock.get_canonical_urls.assert_called_once_with(purl)
+    github_parse_mock.assert_called_once_with(repository_url)
+    sbom_mock.get.assert_called_once_with()
 
-class SbomMockWrapper:
-    def __init__(self, sbom_input: str) -> None:
-        self.sbom = sbom_input
 
+def github_client_stub(
+    sbom_mock: pytest_mock.MockType, owner: str, repo: str
+) -> SimpleNamespace:
+    """Client exposing repos[owner][repo]["dependency-graph"].sbom as sbom_mock."""
+    return SimpleNamespace(
+        repos={owner: {repo: {"dependency-graph": SimpleNamespace(sbom=sbom_mock)}}}
+    )
 
-class GitHubClientMock:
-    def __init__(self, sbom_input: SbomMockWrapper) -> None:
-        # this needs to be accessed: self.repos[owner][repo].sbom and return sbom_input
-        self.repos = {"test_owner": {"test_repo": {"dependency-graph": sbom_input}}}
 
+@pytest.fixture
+def sbom_mock(mocker: pytest_mock.MockFixture) -> pytest_mock.MockType:
+    """Stand-in for the dependency-graph SBOM endpoint; tests set get.return_value."""
+    sbom_mock: pytest_mock.MockType = mocker.Mock()
+    return sbom_mock
 
-def test_github_sbom_collection_strategy_raise_exception_if_error_calling_github_sbom_api(
-    mocker: pytest_mock.MockFixture,
-) -> None:
-    sbom_mock = mocker.Mock()
-    sbom_mock.get.return_value = (500, "Not Found")
-    github_client_mock = GitHubClientMock(sbom_input=SbomMockWrapper(sbom_mock))
-    source_code_manager_mock = mocker.Mock()
+
+@pytest.fixture
+def source_code_manager_mock(mocker: pytest_mock.MockFixture) -> pytest_mock.MockType:
+    """Source code manager resolving every package to test_owner/test_repo."""
+    source_code_manager_mock: pytest_mock.MockType = mocker.Mock(
+        spec_set=SourceCodeManager
+    )
     source_code_manager_mock.get_canonical_urls.return_value = (
         "https://github.com/test_owner/test_repo",
         "https://api.github.com/repos/test_owner/test_repo",
     )
-
-    github_parse_mock = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.github_sbom_collection_strategy.parse_git_url",
-        return_value=GitUrlParseMock(
-            valid=True,
-            platform="github",
-            owner="test_owner",
-            repo="test_repo",
-        ),
-    )
-
-    strategy = GitHubSbomMetadataCollectionStrategy(
-        github_client=github_client_mock,
-        source_code_manager=source_code_manager_mock,
-        project_scope=ProjectScope.ALL,
-    )
-
-    initial_metadata = [
-        Metadata(
-            name="",
-            version="",
-            origin="test_purl",
-            local_src_path="",
-            license=[],
-            copyright=[],
+    return source_code_manager_mock
+
+
+@pytest.fixture
+def strategy_factory(
+    sbom_mock: pytest_mock.MockType,
+    source_code_manager_mock: pytest_mock.MockType,
+) -> Callable[..., GitHubSbomMetadataCollectionStrategy]:
+    """Build strategies wired to the sbom and source code manager mocks."""
+
+    def build(
+        project_scope: ProjectScope,
+        owner: str = "test_owner",
+        repo: str = "test_repo",
+    ) -> GitHubSbomMetadataCollectionStrategy:
+        return GitHubSbomMetadataCollectionStrategy(
+            github_client=github_client_stub(sbom_mock, owner, repo),
+            source_code_manager=source_code_manager_mock,
+            project_scope=project_scope,
         )
-    ]
 
-    # With the new logging, errors are caught and packages are skipped rather than raising
-    # The metadata should be updated with canonical URL but no SBOM data
-    updated_metadata = strategy.augment_metadata(initial_metadata)
+    return build
 
-    # Package should be returned with updated origin but no additional data
-    assert len(updated_metadata) == 1
-    assert updated_metadata[0].origin == "https://github.com/test_owner/test_repo"
 
-    source_code_manager_mock.get_canonical_urls.assert_called_once_with("test_purl")
-    github_parse_mock.assert_called_once_with("https://github.com/test_owner/test_repo")
-    sbom_mock.get.assert_called_once_with()
+@pytest.fixture(autouse=True)
+def github_parse_mock(mocker: pytest_mock.MockFixture) -> pytest_mock.MockType:
+    """Patch parse_git_url in the strategy for every test in this module.
+
+    It parses to test_owner/test_repo by default; tests needing another result
+    request the fixture and set return_value or side_effect on it.
+    """
+    return mocker.patch.object(
+        github_sbom_collection_strategy, "parse_git_url", return_value=_DEFAULT_PARSE
+    )
 
 
-def test_github_sbom_collection_strategy_raise_special_exception_if_error_calling_github_sbom_api_is_404(
-    mocker: pytest_mock.MockFixture,
+def test_github_sbom_collection_strategy_returns_same_metadata_if_not_a_github_repo(
+    sbom_mock: pytest_mock.MockType,
+    source_code_manager_mock: pytest_mock.MockType,
+    strategy_factory: Callable[..., GitHubSbomMetadataCollectionStrategy],
+    github_parse_mock: pytest_mock.MockType,
 ) -> None:
-    sbom_mock = mocker.Mock()
-    sbom_mock.get.return_value = (404, "Not Found")
-    github_client_mock = GitHubClientMock(sbom_input=SbomMockWrapper(sbom_mock))
-    source_code_manager_mock = mocker.Mock()
     source_code_manager_mock.get_canonical_urls.return_value = (
-        "https://github.com/test_owner/test_repo",
-        "https://api.github.com/repos/test_owner/test_repo",
+        "not_a_github_purl",
+        None,
     )
 
-    github_parse_mock = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.github_sbom_collection_strategy.parse_git_url",
-        return_value=GitUrlParseMock(
-            valid=True,
-            platform="github",
-            owner="test_owner",
-            repo="test_repo",
-        ),
-    )
+    strategy = strategy_factory(ProjectScope.ALL)
 
-    strategy = GitHubSbomMetadataCollectionStrategy(
-        github_client=github_client_mock,
-        source_code_manager=source_code_manager_mock,
-        project_scope=ProjectScope.ALL,
-    )
-
-    initial_metadata = [
-        Metadata(
-            name="",
-            version="",
-            origin="test_purl",
-            local_src_path="",
-            license=[],
-            copyright=[],
-        )
-    ]
+    initial_metadata = [empty_metadata("not_a_github_purl")]
 
     updated_metadata = strategy.augment_metadata(initial_metadata)
+    assert updated_metadata == initial_metadata
 
-    # Package should be returned with updated origin but no additional data
-    assert len(updated_metadata) == 1
-    assert updated_metadata[0].origin == "https://github.com/test_owner/test_repo"
-
-    source_code_manager_mock.get_canonical_urls.assert_called_once_with("test_purl")
-    github_parse_mock.assert_called_once_with("https://github.com/test_owner/test_repo")
-    sbom_mock.get.assert_called_once_with()
+    source_code_manager_mock.get_canonical_urls.assert_called_once_with(
+        "not_a_github_purl"
+    )
+    # parse_git_url is not called when api_url is None (early return)
+    github_parse_mock.assert_not_called()
+    sbom_mock.get.assert_not_called()
 
 
-def test_github_sbom_collection_strategy_raise_special_exception_if_error_calling_github_sbom_api_is_401(
-    mocker: pytest_mock.MockFixture,
+@pytest.mark.parametrize(
+    "status, body",
+    [
+        (500, "Not Found"),
+        (404, "Not Found"),
+        (401, "Unauthorized"),
+    ],
+)
+def test_github_sbom_collection_strategy_keeps_package_if_error_calling_github_sbom_api(
+    sbom_mock: pytest_mock.MockType,
+    source_code_manager_mock: pytest_mock.MockType,
+    strategy_factory: Callable[..., GitHubSbomMetadataCollectionStrategy],
+    github_parse_mock: pytest_mock.MockType,
+    status: int,
+    body: str,
 ) -> None:
-    sbom_mock = mocker.Mock()
-    sbom_mock.get.return_value = (401, "Unauthorized")
-    github_client_mock = GitHubClientMock(sbom_input=SbomMockWrapper(sbom_mock))
-    source_code_manager_mock = mocker.Mock()
-    source_code_manager_mock.get_canonical_urls.return_value = (
-        "https://github.com/test_owner/test_repo",
-        "https://api.github.com/repos/test_owner/test_repo",
-    )
+    sbom_mock.get.return_value = (status, body)
 
-    github_parse_mock = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.github_sbom_collection_strategy.parse_git_url",
-        return_value=GitUrlParseMock(
-            valid=True,
-            platform="github",
-            owner="test_owner",
-            repo="test_repo",
-        ),
-    )
-
-    strategy = GitHubSbomMetadataCollectionStrategy(
-        github_client=github_client_mock,
-        source_code_manager=source_code_manager_mock,
-        project_scope=ProjectScope.ALL,
-    )
+    strategy = strategy_factory(ProjectScope.ALL)
 
-    initial_metadata = [
-        Metadata(
-            name="",
-            version="",
-            origin="test_purl",
-            local_src_path="",
-            license=[],
-            copyright=[],
-        )
-    ]
+    initial_metadata = [empty_metadata("test_purl")]
 
+    # Errors (including the NonAccessibleRepository and UnauthorizedRepository
+    # raised for 404 and 401) are logged and the package is kept as is
     updated_metadata = strategy.augment_metadata(initial_metadata)
 
     # Package should be returned with updated origin but no additional data
     assert len(updated_metadata) == 1
     assert updated_metadata[0].origin == "https://github.com/test_owner/test_repo"
 
-    source_code_manager_mock.get_canonical_urls.assert_called_once_with("test_purl")
-    github_parse_mock.assert_called_once_with("https://github.com/test_owner/test_repo")
-    sbom_mock.get.assert_called_once_with()
+    assert_sbom_fetched_once(source_code_manager_mock, github_parse_mock, sbom_mock)
 
 
 def test_github_sbom_collection_strategy_with_no_new_info_skips_actions_and_returns_original_info(
-    mocker: pytest_mock.MockFixture,
+    sbom_mock: pytest_mock.MockType,
+    source_code_manager_mock: pytest_mock.MockType,
+    strategy_factory: Callable[..., GitHubSbomMetadataCollectionStrategy],
+    github_parse_mock: pytest_mock.MockType,
 ) -> None:
-    sbom_mock = mocker.Mock()
     sbom_mock.get.return_value = (
         200,
         {
@@ -254,28 +396,8 @@ def test_github_sbom_collection_strategy_with_no_new_info_skips_actions_and_retu
             }
         },
     )
-    github_client_mock = GitHubClientMock(sbom_input=SbomMockWrapper(sbom_mock))
-    source_code_manager_mock = mocker.Mock()
-    source_code_manager_mock.get_canonical_urls.return_value = (
-        "https://github.com/test_owner/test_repo",
-        "https://api.github.com/repos/test_owner/test_repo",
-    )
 
-    github_parse_mock = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.github_sbom_collection_strategy.parse_git_url",
-        return_value=GitUrlParseMock(
-            valid=True,
-            platform="github",
-            owner="test_owner",
-            repo="test_repo",
-        ),
-    )
-
-    strategy = GitHubSbomMetadataCollectionStrategy(
-        github_client=github_client_mock,
-        source_code_manager=source_code_manager_mock,
-        project_scope=ProjectScope.ALL,
-    )
+    strategy = strategy_factory(ProjectScope.ALL)
 
     initial_metadata = [
         Metadata(
@@ -302,44 +424,16 @@ def test_github_sbom_collection_strategy_with_no_new_info_skips_actions_and_retu
     updated_metadata = strategy.augment_metadata(initial_metadata)
     assert updated_metadata == expected_metadata
 
-    source_code_manager_mock.get_canonical_urls.assert_called_once_with("test_purl")
-    github_parse_mock.assert_called_once_with("https://github.com/test_owner/test_repo")
-    sbom_mock.get.assert_called_once_with()
+    assert_sbom_fetched_once(source_code_manager_mock, github_parse_mock, sbom_mock)
 
 
 def test_github_sbom_collection_strategy_with_new_info_is_not_lost_in_repeated_package(
-    mocker: pytest_mock.MockFixture,
+    sbom_mock: pytest_mock.MockType,
+    source_code_manager_mock: pytest_mock.MockType,
+    strategy_factory: Callable[..., GitHubSbomMetadataCollectionStrategy],
+    github_parse_mock: pytest_mock.MockType,
 ) -> None:
-    sbom_mock = mocker.Mock()
-    sbom_mock.get.return_value = (
-        200,
-        {
-            "sbom": {
-                "packages": [
-                    {
-                        "SPDXID": "SPDXRef-githubactions-somthing-that-acts"
-                    },  # this should be skipped
-                    {  # this is the package from the original metadata with new information
-                        "name": "package1",
-                        "versionInfo": "2.0",
-                        "licenseDeclared": "APACHE-2.0",
-                        "downloadLocation": "test_purl",
-                    },
-                    {  # this was already in the previous line, we keep the new information and not override with this.
-                        "name": "package1"
-                    },
-                    {  # this is a package that is not in the original metadata and has downloadLocation declared
-                        "name": "package3",
-                        "versionInfo": "3.0",
-                        "licenseDeclared": "APACHE-2.0",
-                        "downloadLocation": "test_purl_2",
-                    },
-                ]
-            }
-        },
-    )
-    github_client_mock = GitHubClientMock(sbom_input=SbomMockWrapper(sbom_mock))
-    source_code_manager_mock = mocker.Mock()
+    sbom_mock.get.return_value = _REPEATED_PACKAGE_SBOM_RESPONSE
     # First call is for package1 with origin="test_purl"
     # Second call would be for package2 with origin=None but it returns None API URL so parse_git_url won't be called
     source_code_manager_mock.get_canonical_urls.side_effect = [
@@ -350,16 +444,7 @@ def test_github_sbom_collection_strategy_with_new_info_is_not_lost_in_repeated_p
         (None, None),
     ]
 
-    giturlparse_mock = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.github_sbom_collection_strategy.parse_git_url",
-        return_value=GitUrlParseMock(True, "github", "test_owner", "test_repo"),
-    )
-
-    strategy = GitHubSbomMetadataCollectionStrategy(
-        github_client=github_client_mock,
-        source_code_manager=source_code_manager_mock,
-        project_scope=ProjectScope.ALL,
-    )
+    strategy = strategy_factory(ProjectScope.ALL)
 
     initial_metadata = [
         Metadata(
@@ -380,163 +465,87 @@ def test_github_sbom_collection_strategy_with_new_info_is_not_lost_in_repeated_p
         ),
     ]
 
-    expected_metadata = [
-        Metadata(
-            name="package1",
-            version="2.0",
-            origin="https://github.com/test_owner/test_repo",
-            local_src_path=None,
-            license=["APACHE-2.0"],
-            copyright=[],
-        ),
-        Metadata(
-            name="package2",
-            version=None,
-            origin=None,
-            local_src_path=None,
-            license=[],
-            copyright=[],
-        ),
-        Metadata(
-            name="package3",
-            version="3.0",
-            origin="test_purl_2",
-            local_src_path=None,
-            license=["APACHE-2.0"],
-            copyright=[],
-        ),
-    ]
-
     updated_metadata = strategy.augment_metadata(initial_metadata)
-    assert sorted(updated_metadata, key=str) == sorted(expected_metadata, key=str)
+    assert Counter(map(metadata_key, updated_metadata)) == Counter(
+        map(metadata_key, _EXPECTED_REPEATED_PACKAGE_METADATA)
+    )
 
     # parse_git_url is only called once for the first package with a valid GitHub URL
-    giturlparse_mock.assert_called_once_with("https://github.com/test_owner/test_repo")
+    github_parse_mock.assert_called_once_with("https://github.com/test_owner/test_repo")
 
     sbom_mock.get.assert_called_once_with()
 
 
-def test_strategy_does_not_add_dependencies_with_transitive_dependencies_is_false(
-    mocker: pytest_mock.MockFixture,
-) -> None:
-    sbom_mock = mocker.Mock()
-    sbom_mock.get.return_value = (
-        200,
-        {
-            "sbom": {
-                "packages": [
-                    {
-                        "name": "package1",
-                        "versionInfo": "2.0",
-                        "licenseDeclared": "APACHE-2.0",
-                        "downloadLocation": "test_purl",
-                    },
-                    {
-                        "name": "package2",
-                        "versionInfo": "3.0",
-                        "licenseDeclared": "APACHE-2.0",
-                        "downloadLocation": "test_purl_2",
-                    },
-                ]
-            }
-        },
-    )
-    github_client_mock = GitHubClientMock(sbom_input=SbomMockWrapper(sbom_mock))
-    source_code_manager_mock = mocker.Mock()
-    source_code_manager_mock.get_canonical_urls.return_value = (
-        "https://github.com/test_owner/test_repo",
-        "https://api.github.com/repos/test_owner/test_repo",
-    )
-
-    github_parse_mock = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.github_sbom_collection_strategy.parse_git_url",
-        return_value=GitUrlParseMock(
-            valid=True,
-            platform="github",
-            owner="test_owner",
-            repo="test_repo",
+@pytest.mark.parametrize(
+    "project_scope, sbom_response, expected_metadata",
+    [
+        pytest.param(
+            ProjectScope.ALL,
+            _TWO_PACKAGE_SBOM_RESPONSE,
+            [
+                Metadata(
+                    name="package1",
+                    version="2.0",
+                    origin="https://github.com/test_owner/test_repo",
+                    local_src_path=None,
+                    license=["APACHE-2.0"],
+                    copyright=[],
+                ),
+                Metadata(
+                    name="package2",
+                    version="3.0",
+                    origin="test_purl_2",
+                    local_src_path=None,
+                    license=["APACHE-2.0"],
+                    copyright=[],
+                ),
+            ],
+            id="keeps_root_project_and_transitive_dependencies",
         ),
-    )
-
-    strategy = GitHubSbomMetadataCollectionStrategy(
-        github_client=github_client_mock,
-        source_code_manager=source_code_manager_mock,
-        project_scope=ProjectScope.ONLY_ROOT_PROJECT,
-    )
-
-    initial_metadata = [
-        Metadata(
-            name="package1",
-            version=None,
-            origin="test_purl",
-            local_src_path=None,
-            license=[],
-            copyright=[],
-        )
-    ]
-
-    updated_metadata = strategy.augment_metadata(initial_metadata)
-
-    expected_metadata = [
-        Metadata(
-            name="package1",
-            version="2.0",
-            origin="https://github.com/test_owner/test_repo",
-            local_src_path=None,
-            license=["APACHE-2.0"],
-            copyright=[],
-        )
-    ]
-
-    assert updated_metadata == expected_metadata
-
-    source_code_manager_mock.get_canonical_urls.assert_called_once_with("test_purl")
-    github_parse_mock.assert_called_once_with("https://github.com/test_owner/test_repo")
-    sbom_mock.get.assert_called_once_with()
-
-
-def test_strategy_does_not_keep_root_when_with_root_project_is_false(
-    mocker: pytest_mock.MockFixture,
+        pytest.param(
+            ProjectScope.ONLY_ROOT_PROJECT,
+            _TWO_PACKAGE_SBOM_RESPONSE,
+            [
+                Metadata(
+                    name="package1",
+                    version="2.0",
+                    origin="https://github.com/test_owner/test_repo",
+                    local_src_path=None,
+                    license=["APACHE-2.0"],
+                    copyright=[],
+                )
+            ],
+            id="does_not_add_transitive_dependencies",
+        ),
+        pytest.param(
+            ProjectScope.ONLY_TRANSITIVE_DEPENDENCIES,
+            _ROOT_AND_DEPENDENCY_SBOM_RESPONSE,
+            [
+                Metadata(
+                    name="package2",
+                    version="3.0",
+                    origin="test_purl_2",
+                    local_src_path=None,
+                    license=["APACHE-2.0"],
+                    copyright=[],
+                )
+            ],
+            id="does_not_keep_root_project",
+        ),
+    ],
+)
+def test_strategy_filters_sbom_packages_by_project_scope(
+    sbom_mock: pytest_mock.MockType,
+    source_code_manager_mock: pytest_mock.MockType,
+    strategy_factory: Callable[..., GitHubSbomMetadataCollectionStrategy],
+    github_parse_mock: pytest_mock.MockType,
+    project_scope: ProjectScope,
+    sbom_response: tuple[int, dict[str, Any]],
+    expected_metadata: list[Metadata],
 ) -> None:
-    sbom_mock = mocker.Mock()
-    sbom_mock.get.return_value = (
-        200,
-        {
-            "sbom": {
-                "packages": [
-                    {
-                        "name": "com.github.test_owner/test_repo",
-                        "versionInfo": "2.0",
-                        "licenseDeclared": "APACHE-2.0",
-                        "downloadLocation": "test_purl",
-                    },
-                    {
-                        "name": "package2",
-                        "versionInfo": "3.0",
-                        "licenseDeclared": "APACHE-2.0",
-                        "downloadLocation": "test_purl_2",
-                    },
-                ]
-            }
-        },
-    )
-    github_client_mock = GitHubClientMock(sbom_input=SbomMockWrapper(sbom_mock))
-    source_code_manager_mock = mocker.Mock()
-    source_code_manager_mock.get_canonical_urls.return_value = (
-        "https://github.com/test_owner/test_repo",
-        "https://api.github.com/repos/test_owner/test_repo",
-    )
+    sbom_mock.get.return_value = sbom_response
 
-    github_parse_mock = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.github_sbom_collection_strategy.parse_git_url",
-        return_value=GitUrlParseMock(True, "github", "test_owner", "test_repo"),
-    )
-
-    strategy = GitHubSbomMetadataCollectionStrategy(
-        github_client=github_client_mock,
-        source_code_manager=source_code_manager_mock,
-        project_scope=ProjectScope.ONLY_TRANSITIVE_DEPENDENCIES,
-    )
+    strategy = strategy_factory(project_scope)
 
     initial_metadata = [
         Metadata(
@@ -551,28 +560,17 @@ def test_strategy_does_not_keep_root_when_with_root_project_is_false(
 
     updated_metadata = strategy.augment_metadata(initial_metadata)
 
-    expected_metadata = [
-        Metadata(
-            name="package2",
-            version="3.0",
-            origin="test_purl_2",
-            local_src_path=None,
-            license=["APACHE-2.0"],
-            copyright=[],
-        )
-    ]
-
     assert updated_metadata == expected_metadata
 
-    source_code_manager_mock.get_canonical_urls.assert_called_once_with("test_purl")
-    github_parse_mock.assert_called_once_with("https://github.com/test_owner/test_repo")
-    sbom_mock.get.assert_called_once_with()
+    assert_sbom_fetched_once(source_code_manager_mock, github_parse_mock, sbom_mock)
 
 
 def test_github_sbom_collection_strategy_handles_company_names_in_copyright(
-    mocker: pytest_mock.MockFixture,
+    sbom_mock: pytest_mock.MockType,
+    source_code_manager_mock: pytest_mock.MockType,
+    strategy_factory: Callable[..., GitHubSbomMetadataCollectionStrategy],
+    github_parse_mock: pytest_mock.MockType,
 ) -> None:
-    sbom_mock = mocker.Mock()
     sbom_mock.get.return_value = (
         200,
         {
@@ -586,26 +584,14 @@ def test_github_sbom_collection_strategy_handles_company_names_in_copyright(
             }
         },
     )
-    mock_client = mocker.Mock()
-    mock_client.repos = {
-        "test-owner": {"test-repo": {"dependency-graph": SbomMockWrapper(sbom_mock)}}
-    }
-    source_code_manager_mock = mocker.Mock()
     source_code_manager_mock.get_canonical_urls.return_value = (
         "https://github.com/test-owner/test-repo",
         "https://api.github.com/repos/test-owner/test-repo",
     )
 
-    mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.github_sbom_collection_strategy.parse_git_url",
-        return_value=GitUrlParseMock(True, "github", "test-owner", "test-repo"),
-    )
+    github_parse_mock.return_value = _HYPHENATED_PARSE
 
-    strategy = GitHubSbomMetadataCollectionStrategy(
-        github_client=mock_client,
-        source_code_manager=source_code_manager_mock,
-        project_scope=ProjectScope.ALL,
-    )
+    strategy = strategy_factory(ProjectScope.ALL, owner="test-owner", repo="test-repo")
     cleanup_copyright_metadata_strategy = CleanupCopyrightMetadataStrategy()
 
     initial_metadata = [
@@ -630,60 +616,24 @@ def test_github_sbom_collection_strategy_handles_company_names_in_copyright(
         "Company Datadog",
     ]
 
-
-def test_github_sbom_collection_strategy_uses_name_as_origin_if_download_location_is_empty_or_noassertion(
-    mocker: pytest_mock.MockFixture,
-) -> None:
-    sbom_data = (
-        200,
-        {
-            "sbom": {
-                "packages": [
-                    {
-                        "name": "package0",
-                        "versionInfo": "4.0",
-                        "licenseDeclared": "MIT",
-                        "copyrightText": "Copyright 1",
-                        "downloadLocation": "test_purl",
-                    },
-                    {
-                        "name": "github.com/package1",
-                        "versionInfo": "2.0",
-                        "licenseConcluded": "MIT",
-                        "copyrightText": "Copyright 2",
-                        "downloadLocation": "",
-                    },
-                    {
-                        "name": "github.com/package2",
-                        "versionInfo": "3.0",
-                        "licenseConcluded": "MIT",
-                        "copyrightText": "Copyright 3",
-                        "downloadLocation": "NOASSERTION",
-                    },
-                ]
-            }
-        },
+    assert_sbom_fetched_once(
+        source_code_manager_mock,
+        github_parse_mock,
+        sbom_mock,
+        purl="https://github.com/test-owner/test-repo",
+        repository_url="https://github.com/test-owner/test-repo",
     )
-    sbom_mock = mocker.Mock()
-    sbom_mock.get.return_value = sbom_data
 
-    github_client_mock = GitHubClientMock(sbom_input=SbomMockWrapper(sbom_mock))
-    source_code_manager_mock = mocker.Mock()
-    source_code_manager_mock.get_canonical_urls.return_value = (
-        "https://github.com/test_owner/test_repo",
-        "https://api.github.com/repos/test_owner/test_repo",
-    )
 
-    giturlparse_mock = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.github_sbom_collection_strategy.parse_git_url",
-        return_value=GitUrlParseMock(True, "github", "test_owner", "test_repo"),
-    )
+def test_github_sbom_collection_strategy_uses_name_as_origin_if_download_location_is_empty_or_noassertion(
+    sbom_mock: pytest_mock.MockType,
+    source_code_manager_mock: pytest_mock.MockType,
+    strategy_factory: Callable[..., GitHubSbomMetadataCollectionStrategy],
+    github_parse_mock: pytest_mock.MockType,
+) -> None:
+    sbom_mock.get.return_value = _NAME_AS_ORIGIN_SBOM_RESPONSE
 
-    strategy = GitHubSbomMetadataCollectionStrategy(
-        github_client=github_client_mock,
-        source_code_manager=source_code_manager_mock,
-        project_scope=ProjectScope.ALL,
-    )
+    strategy = strategy_factory(ProjectScope.ALL)
 
     initial_metadata = [
         Metadata(
@@ -697,35 +647,53 @@ def test_github_sbom_collection_strategy_uses_name_as_origin_if_download_locatio
     ]
 
     updated_metadata = strategy.augment_metadata(initial_metadata)
-    expected_metadata = [
-        Metadata(
-            name="package0",
-            version="4.0",
-            origin="https://github.com/test_owner/test_repo",
-            local_src_path=None,
-            license=["MIT"],
-            copyright=["Copyright 1"],
-        ),
-        Metadata(
-            name="github.com/package1",
-            version="2.0",
-            origin="https://github.com/package1",
-            local_src_path=None,
-            license=["MIT"],
-            copyright=["Copyright 2"],
-        ),
-        Metadata(
-            name="github.com/package2",
-            version="3.0",
-            origin="https://github.com/package2",
-            local_src_path=None,
-            license=["MIT"],
-            copyright=["Copyright 3"],
-        ),
-    ]
 
-    assert updated_metadata == expected_metadata
+    assert updated_metadata == _EXPECTED_NAME_AS_ORIGIN_METADATA
 
-    source_code_manager_mock.get_canonical_urls.assert_called_once_with("test_purl")
-    giturlparse_mock.assert_called_once_with("https://github.com/test_owner/test_repo")
+    assert_sbom_fetched_once(source_code_manager_mock, github_parse_mock, sbom_mock)
+
+
+def test_github_sbom_collection_strategy_fetches_sbom_once_per_repository(
+    sbom_mock: pytest_mock.MockType,
+    source_code_manager_mock: pytest_mock.MockType,
+    strategy_factory: Callable[..., GitHubSbomMetadataCollectionStrategy],
+    github_parse_mock: pytest_mock.MockType,
+) -> None:
+    sbom_mock.get.return_value = (200, {"sbom": {"packages": []}})
+
+    strategy = strategy_factory(ProjectScope.ALL)
+
+    initial_metadata = [empty_metadata("test_purl"), empty_metadata("test_purl_2")]
+
+    updated_metadata = strategy.augment_metadata(initial_metadata)
+
+    assert len(updated_metadata) == 2
+    assert source_code_manager_mock.get_canonical_urls.call_count == 2
+    source_code_manager_mock.get_canonical_urls.assert_any_call("test_purl")
+    source_code_manager_mock.get_canonical_urls.assert_any_call("test_purl_2")
+    assert github_parse_mock.call_count == 2
+    # Both packages resolve to test_owner/test_repo, so the SBOM is downloaded once
     sbom_mock.get.assert_called_once_with()
+
+
+def test_github_sbom_collection_strategy_retries_sbom_after_failed_fetch(
+    sbom_mock: pytest_mock.MockType,
+    source_code_manager_mock: pytest_mock.MockType,
+    strategy_factory: Callable[..., GitHubSbomMetadataCollectionStrategy],
+    github_parse_mock: pytest_mock.MockType,
+) -> None:
+    sbom_mock.get.side_effect = [
+        (500, "Internal Server Error"),
+        (200, {"sbom": {"packages": []}}),
+    ]
+
+    strategy = strategy_factory(ProjectScope.ALL)
+
+    initial_metadata = [empty_metadata("test_purl"), empty_metadata("test_purl_2")]
+
+    updated_metadata = strategy.augment_metadata(initial_metadata)
+
+    assert len(updated_metadata) == 2
+    assert github_parse_mock.call_count == 2
+    # Failed responses are not cached, so the second package fetches again
+    assert sbom_mock.get.call_count == 2
@@ -17,10 +17,18 @@ from dd_license_attribution.artifact_management.go_package_resolver import (
 )
 from dd_license_attribution.metadata_collector.metadata import Metadata
 from dd_license_attribution.metadata_collector.project_scope import ProjectScope
+from dd_license_attribution.metadata_collector.strategies import (
+    gopkg_collection_strategy,
+)
 from dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy import (
     GoPkgMetadataCollectionStrategy,
 )
 
+# git ls-remote --symref output for a repository whose HEAD is main.
+MAIN_BRANCH_LS_REMOTE_OUTPUT = (
+    "ref: refs/heads/main\tHEAD\n72a11341aa684010caf1ca5dee779f0e7e84dfe9\tHEAD\n"
+)
+
 
 def test_gopkg_collection_strategy_do_not_decrement_list_of_dependencies_if_not_go_related(
     mocker: pytest_mock.MockFixture,
@@ -80,8 +88,8 @@ def test_gopkg_collection_strategy_adds_gopkg_metadata_to_list_of_dependencies(
         local_full_path="cache_dir/org_package1",
     )
 
-    mock_walk_directory = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.walk_directory"
+    mock_walk_directory = mocker.patch.object(
+        gopkg_collection_strategy, "walk_directory"
     )
     mock_walk_directory.return_value = [
         ("org_package1", ["package3", "ignore"], ["go.mod", "test"]),
@@ -89,8 +97,8 @@ def test_gopkg_collection_strategy_adds_gopkg_metadata_to_list_of_dependencies(
         ("org_package1/ignore", [], ["license"]),
     ]
 
-    mock_output_from_command = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command"
+    mock_output_from_command = mocker.patch.object(
+        gopkg_collection_strategy, "output_from_command"
     )
 
     deps_list_json_1 = """
@@ -134,18 +142,15 @@ def test_gopkg_collection_strategy_adds_gopkg_metadata_to_list_of_dependencies(
     }
 }"""
 
-    branch_detection_output = (
-        "ref: refs/heads/main\tHEAD\n72a11341aa684010caf1ca5dee779f0e7e84dfe9\tHEAD\n"
-    )
-
     mock_output_from_command.side_effect = [
         deps_list_json_1,
-        branch_detection_output,
+        MAIN_BRANCH_LS_REMOTE_OUTPUT,
         deps_list_json_3,
     ]
 
-    mock_open_file = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.open_file",
+    mock_open_file = mocker.patch.object(
+        gopkg_collection_strategy,
+        "open_file",
         return_value="module github.com/org/package1",
     )
 
@@ -266,8 +271,8 @@ def test_gopkg_collection_strategy_adds_gopkg_metadata_to_list_of_dependencies_b
         local_full_path="cache_dir/org_package1",
     )
 
-    mock_walk_directory = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.walk_directory"
+    mock_walk_directory = mocker.patch.object(
+        gopkg_collection_strategy, "walk_directory"
     )
     mock_walk_directory.return_value = [
         ("org_package1", ["src", "examples"], ["go.mod"]),
@@ -275,8 +280,9 @@ def test_gopkg_collection_strategy_adds_gopkg_metadata_to_list_of_dependencies_b
         ("org_package1/examples", [], ["go.mod"]),
     ]
 
-    mock_open_file = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.open_file",
+    mock_open_file = mocker.patch.object(
+        gopkg_collection_strategy,
+        "open_file",
         side_effect=[
             "module github.com/org/package1",
             "module github.com/org/package1/src",
@@ -316,15 +322,12 @@ require github.com/org/package1 v1.0
     }
 }"""
 
-    branch_detection_output = (
-        "ref: refs/heads/main\tHEAD\n72a11341aa684010caf1ca5dee779f0e7e84dfe9\tHEAD\n"
-    )
-
-    mock_output_from_command = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command",
+    mock_output_from_command = mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
         side_effect=[
             deps_list_json_top,
-            branch_detection_output,
+            MAIN_BRANCH_LS_REMOTE_OUTPUT,
             deps_list_json_src,
         ],
     )
@@ -437,8 +440,8 @@ def test_gopkg_collection_strategy_only_updates_local_source_path_when_only_root
         local_full_path="cache_dir/org_package1",
     )
 
-    mock_walk_directory = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.walk_directory"
+    mock_walk_directory = mocker.patch.object(
+        gopkg_collection_strategy, "walk_directory"
     )
 
     mock_walk_directory.return_value = [
@@ -446,8 +449,9 @@ def test_gopkg_collection_strategy_only_updates_local_source_path_when_only_root
         ("org_package1/src", [], ["go.mod"]),
     ]
 
-    mock_open_file = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.open_file",
+    mock_open_file = mocker.patch.object(
+        gopkg_collection_strategy,
+        "open_file",
         return_value="module github.com/org/package1",
     )
 
@@ -478,8 +482,9 @@ def test_gopkg_collection_strategy_only_updates_local_source_path_when_only_root
     }
 }"""
 
-    mock_output_from_command = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command",
+    mock_output_from_command = mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
         return_value=deps_list_json_top,
     )
 
@@ -571,8 +576,9 @@ def test_gopkg_local_project_path_skips_get_code_and_resolves_dependencies(
     }
 }"""
 
-    mock_output_from_command = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command",
+    mock_output_from_command = mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
         return_value=deps_list_json,
     )
 
@@ -643,8 +649,9 @@ def test_gopkg_local_project_path_filters_synthetic_module(
     }}
 }}""".format(synthetic=SYNTHETIC_MODULE_NAME)
 
-    mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command",
+    mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
         return_value=deps_list_json,
     )
 
@@ -690,8 +697,9 @@ def test_gopkg_local_project_path_removes_seed_entry(
     }
 }"""
 
-    mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command",
+    mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
         return_value=deps_list_json,
     )
 
@@ -754,8 +762,9 @@ def test_gopkg_local_project_path_only_root_project(
     }
 }"""
 
-    mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command",
+    mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
         return_value=deps_list_json,
     )
 
@@ -814,8 +823,9 @@ def test_gopkg_local_project_path_only_root_project_with_versioned_spec(
     }
 }"""
 
-    mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command",
+    mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
         return_value=deps_list_json,
     )
 
@@ -869,8 +879,9 @@ def test_gopkg_local_project_path_only_root_project_does_not_match_v1_for_v2_spe
     }
 }"""
 
-    mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command",
+    mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
         return_value=deps_list_json,
     )
 
@@ -923,8 +934,9 @@ def test_gopkg_local_project_path_only_root_project_with_subpackage_spec(
     }
 }"""
 
-    mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command",
+    mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
         return_value=deps_list_json,
     )
 
@@ -959,8 +971,9 @@ def test_gopkg_local_project_path_empty_output_returns_metadata(
         local_project_path="/tmp/go-resolve/testify",
     )
 
-    mock_output_from_command = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command",
+    mock_output_from_command = mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
         return_value="",
     )
 
@@ -1003,8 +1016,9 @@ def test_gopkg_local_project_path_updates_existing_metadata(
     }
 }"""
 
-    mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command",
+    mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
         return_value=deps_list_json,
     )
 
@@ -1033,6 +1047,7 @@ def test_gopkg_local_project_path_updates_existing_metadata(
     # testify should be updated in place, not duplicated
     assert len(result) == 1
     testify = result[0]
+    assert testify is initial_metadata[1]
     assert testify.name == "github.com/stretchr/testify"
     assert testify.origin == "https://github.com/stretchr/testify"
     assert (
@@ -1085,8 +1100,9 @@ def test_gopkg_local_project_path_indirect_dep_without_dir(
     }
 }"""
 
-    mock_output_from_command = mocker.patch(
-        "dd_license_attribution.metadata_collector.strategies.gopkg_collection_strategy.output_from_command",
+    mock_output_from_command = mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
         return_value=deps_list_json,
     )
 
@@ -1123,3 +1139,263 @@ def test_gopkg_local_project_path_indirect_dep_without_dir(
         cwd="/tmp/go-resolve/testify",
         env={"GOTOOLCHAIN": "auto"},
     )
+
+
+def test_gopkg_runs_go_list_once_per_directory(
+    mocker: pytest_mock.MockFixture,
+) -> None:
+    mock_source_code_manager = mocker.Mock()
+    strategy = GoPkgMetadataCollectionStrategy(
+        "github.com/stretchr/testify",
+        mock_source_code_manager,
+        ProjectScope.ALL,
+        local_project_path="/tmp/go-resolve/testify",
+    )
+
+    deps_list_json = """
+{
+    "ImportPath": "github.com/davecgh/go-spew/spew",
+    "Module": {
+        "Path": "github.com/davecgh/go-spew",
+        "Version": "v1.1.1",
+        "Dir": "/tmp/go/pkg/mod/github.com/davecgh/go-spew@v1.1.1"
+    }
+}"""
+
+    mock_output_from_command = mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
+        return_value=deps_list_json,
+    )
+
+    first_result = strategy.augment_metadata([])
+    second_result = strategy.augment_metadata([])
+
+    assert first_result == second_result
+    assert len(second_result) == 1
+    assert second_result[0].name == "github.com/davecgh/go-spew"
+    assert second_result[0].version == "v1.1.1"
+    mock_output_from_command.assert_called_once_with(
+        ["go", "list", "-json", "all"],
+        cwd="/tmp/go-resolve/testify",
+        env={"GOTOOLCHAIN": "auto"},
+    )
+
+
+def test_gopkg_decodes_go_list_output_with_irregular_whitespace(
+    mocker: pytest_mock.MockFixture,
+) -> None:
+    mock_source_code_manager = mocker.Mock()
+    strategy = GoPkgMetadataCollectionStrategy(
+        "github.com/stretchr/testify",
+        mock_source_code_manager,
+        ProjectScope.ALL,
+        local_project_path="/tmp/go-resolve/testify",
+    )
+
+    deps_list_json = (
+        '{"ImportPath": "bytes", "Standard": true}\n\n'
+        '{"ImportPath": "github.com/davecgh/go-spew/spew", "Module": '
+        '{"Path": "github.com/davecgh/go-spew", "Version": "v1.1.1"}}'
+        '{"ImportPath": "github.com/pmezard/go-difflib/difflib", "Module": '
+        '{"Path": "github.com/pmezard/go-difflib", "Version": "v1.0.0"}}\n  '
+    )
+
+    mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
+        return_value=deps_list_json,
+    )
+
+    result = strategy.augment_metadata([])
+
+    assert [(m.name, m.version) for m in result] == [
+        ("github.com/davecgh/go-spew", "v1.1.1"),
+        ("github.com/pmezard/go-difflib", "v1.0.0"),
+    ]
+
+
+def test_gopkg_collection_strategy_prunes_ignored_directories_from_walk(
+    mocker: pytest_mock.MockFixture,
+) -> None:
+    mock_source_code_manager = mocker.Mock()
+    mock_source_code_manager.get_canonical_urls.return_value = (
+        "https://github.com/org/package1",
+        None,
+    )
+    mock_source_code_manager.get_code.return_value = SourceCodeReference(
+        repo_url="https://github.com/org/package1",
+        branch="main",
+        local_root_path="cache_dir/org_package1",
+        local_full_path="cache_dir/org_package1",
+    )
+    strategy = GoPkgMetadataCollectionStrategy(
+        "https://github.com/org/package1", mock_source_code_manager, ProjectScope.ALL
+    )
+
+    root_dirs = ["src", "vendor", "testdata", ".git", "_tools", "node_modules"]
+    example_dirs = ["nested"]
+    mocker.patch.object(
+        gopkg_collection_strategy,
+        "walk_directory",
+        return_value=[
+            ("org_package1", root_dirs, ["README.md"]),
+            ("org_package1/examples", example_dirs, ["go.mod"]),
+        ],
+    )
+    mocker.patch.object(
+        gopkg_collection_strategy,
+        "open_file",
+        return_value="""
+module github.com/org/package1/examples
+require github.com/org/package1 v1.0
+""",
+    )
+    mock_output_from_command = mocker.patch.object(
+        gopkg_collection_strategy, "output_from_command"
+    )
+
+    result = strategy.augment_metadata([])
+
+    assert result == []
+    assert root_dirs == ["src"]
+    assert example_dirs == []
+    mock_output_from_command.assert_not_called()
+
+
+def test_gopkg_is_example_package_reads_module_after_comments(
+    mocker: pytest_mock.MockFixture,
+) -> None:
+    mock_source_code_manager = mocker.Mock()
+    mock_source_code_manager.get_canonical_urls.return_value = (
+        "https://github.com/org/package1",
+        None,
+    )
+    strategy = GoPkgMetadataCollectionStrategy(
+        "https://github.com/org/package1", mock_source_code_manager, ProjectScope.ALL
+    )
+    mock_open_file = mocker.patch.object(
+        gopkg_collection_strategy,
+        "open_file",
+        return_value="""// Examples for package1.
+// Not part of the public API.
+module github.com/org/package1/examples
+
+go 1.21
+
+require github.com/org/package1 v1.0.0
+""",
+    )
+
+    assert strategy._is_example_package("org_package1/examples")
+    mock_open_file.assert_called_once_with("org_package1/examples/go.mod")
+
+
+def test_gopkg_detects_head_branch_once_per_repository(
+    mocker: pytest_mock.MockFixture,
+) -> None:
+    mock_source_code_manager = mocker.Mock()
+    strategy = GoPkgMetadataCollectionStrategy(
+        "github.com/org/repo/module1",
+        mock_source_code_manager,
+        ProjectScope.ALL,
+        local_project_path="/tmp/go-resolve/repo",
+    )
+
+    deps_list_json = """
+{
+    "ImportPath": "github.com/org/repo/module1",
+    "Module": {
+        "Path": "github.com/org/repo/module1",
+        "Version": "v1.0.0"
+    }
+}
+{
+    "ImportPath": "github.com/org/repo/module2",
+    "Module": {
+        "Path": "github.com/org/repo/module2",
+        "Version": "v2.0.0"
+    }
+}"""
+    mock_output_from_command = mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
+        side_effect=[deps_list_json, MAIN_BRANCH_LS_REMOTE_OUTPUT],
+    )
+
+    strategy.augment_metadata([])
+    result = strategy.augment_metadata([])
+
+    assert [m.origin for m in result] == [
+        "https://github.com/org/repo/tree/main/module1",
+        "https://github.com/org/repo/tree/main/module2",
+    ]
+    assert mock_output_from_command.call_count == 2
+    mock_output_from_command.assert_called_with(
+        ["git", "ls-remote", "--symref", "https://github.com/org/repo", "HEAD"]
+    )
+
+
+def test_gopkg_updates_first_metadata_entry_with_matching_name(
+    mocker: pytest_mock.MockFixture,
+) -> None:
+    mock_source_code_manager = mocker.Mock()
+    strategy = GoPkgMetadataCollectionStrategy(
+        "github.com/stretchr/testify",
+        mock_source_code_manager,
+        ProjectScope.ALL,
+        local_project_path="/tmp/go-resolve/testify",
+    )
+
+    mocker.patch.object(
+        gopkg_collection_strategy,
+        "output_from_command",
+        return_value="""
+{
+    "ImportPath": "golang.org/x/sys/unix",
+    "Module": {
+        "Path": "golang.org/x/sys",
+        "Version": "v0.20.0"
+    }
+}""",
+    )
+
+    initial_metadata = [
+        Metadata(
+            name="golang.org/x/sys",
+            origin=None,
+            local_src_path=None,
+            license=[],
+            version=None,
+            copyright=[],
+        ),
+        Metadata(
+            name="golang.org/x/sys",
+            origin=None,
+            local_src_path=None,
+            license=["BSD-3-Clause"],
+            version="v0.19.0",
+            copyright=[],
+        ),
+    ]
+
+    result = strategy.augment_metadata(initial_metadata)
+
+    assert result == [
+        Metadata(
+            name="golang.org/x/sys",
+            origin="https://golang.org/x/sys",
+            local_src_path=None,
+            license=[],
+            version="v0.20.0",
+            copyright=[],
+        ),
+        Metadata(
+            name="golang.org/x/sys",
+            origin=None,
+            local_src_path=None,
+            license=["BSD-3-Clause"],
+            version="v0.19.0",
+            copyright=[],
+        ),
+    ]
@@ -6,6 +6,9 @@
 # Copyright 2025-present Datadog, Inc.
 
 import json
+from typing import Any
+
+import pytest
 
 from dd_license_attribution.metadata_collector.metadata import Metadata
 from dd_license_attribution.metadata_collector.strategies.override_strategy import (
@@ -18,43 +21,90 @@ from dd_license_attribution.overrides_generator.writers.json_overrides_writer im
 )
 
 
-def test_json_overrides_writer_writes_replace_rule_to_file() -> None:
-    """Test writing a REPLACE override rule returns JSON string."""
-    override_rules = [
-        OverrideRule(
-            override_type=OverrideType.REPLACE,
-            target={
-                OverrideTargetField.COMPONENT: "test-component",
-                OverrideTargetField.ORIGIN: "https://github.com/test/repo",
+@pytest.mark.parametrize(
+    "override_rule, expected_json_rule",
+    [
+        pytest.param(
+            OverrideRule(
+                override_type=OverrideType.REPLACE,
+                target={
+                    OverrideTargetField.COMPONENT: "test-component",
+                    OverrideTargetField.ORIGIN: "https://github.com/test/repo",
+                },
+                replacement=Metadata(
+                    name="test-component",
+                    version="1.0.0",
+                    origin="https://github.com/test/repo",
+                    local_src_path="/path/to/src",
+                    license=["MIT"],
+                    copyright=["Test Author"],
+                ),
+            ),
+            # version and local_src_path are internal fields and are not written
+            {
+                "override_type": "replace",
+                "target": {
+                    "component": "test-component",
+                    "origin": "https://github.com/test/repo",
+                },
+                "replacement": {
+                    "name": "test-component",
+                    "origin": "https://github.com/test/repo",
+                    "license": ["MIT"],
+                    "copyright": ["Test Author"],
+                },
             },
-            replacement=Metadata(
-                name="test-component",
-                version="1.0.0",
-                origin="https://github.com/test/repo",
-                local_src_path="/path/to/src",
-                license=["MIT"],
-                copyright=["Test Author"],
+            id="replace",
+        ),
+        pytest.param(
+            OverrideRule(
+                override_type=OverrideType.REMOVE,
+                target={OverrideTargetField.ORIGIN: "https://github.com/test/remove"},
+                replacement=None,
             ),
-        )
-    ]
-
+            {
+                "override_type": "remove",
+                "target": {"origin": "https://github.com/test/remove"},
+                "replacement": None,
+            },
+            id="remove",
+        ),
+        pytest.param(
+            OverrideRule(
+                override_type=OverrideType.ADD,
+                target={OverrideTargetField.COMPONENT: "new-component"},
+                replacement=Metadata(
+                    name="new-component",
+                    version=None,
+                    origin="https://github.com/new/component",
+                    local_src_path=None,
+                    license=["BSD-3-Clause"],
+                    copyright=["New Author"],
+                ),
+            ),
+            {
+                "override_type": "add",
+                "target": {"component": "new-component"},
+                "replacement": {
+                    "name": "new-component",
+                    "origin": "https://github.com/new/component",
+                    "license": ["BSD-3-Clause"],
+                    "copyright": ["New Author"],
+                },
+            },
+            id="add",
+        ),
+    ],
+)
+def test_json_overrides_writer_writes_single_rule(
+    override_rule: OverrideRule, expected_json_rule: dict[str, Any]
+) -> None:
+    """Test writing a single override rule of each type returns JSON string."""
     json_writer = JSONOverridesWriter()
-    result = json_writer.write(override_rules)
+    result = json_writer.write([override_rule])
 
     assert isinstance(result, str)
-    json_content = json.loads(result)
-
-    assert len(json_content) == 1
-    assert json_content[0]["override_type"] == "replace"
-    assert json_content[0]["target"]["component"] == "test-component"
-    assert json_content[0]["target"]["origin"] == "https://github.com/test/repo"
-    assert json_content[0]["replacement"]["name"] == "test-component"
-    assert json_content[0]["replacement"]["origin"] == "https://github.com/test/repo"
-    assert json_content[0]["replacement"]["license"] == ["MIT"]
-    assert json_content[0]["replacement"]["copyright"] == ["Test Author"]
-    # Verify internal fields are not included
-    assert "version" not in json_content[0]["replacement"]
-    assert "local_src_path" not in json_content[0]["replacement"]
+    assert json.loads(result) == [expected_json_rule]
 
 
 def test_json_overrides_writer_writes_multiple_rules() -> None:
@@ -108,53 +158,26 @@ def test_json_overrides_writer_writes_multiple_rules() -> None:
     ]
 
 
-def test_json_overrides_writer_writes_remove_rule_with_no_replacement() -> None:
-    """Test writing a REMOVE override rule returns JSON string."""
+def test_json_overrides_writer_output_is_indented_json_array() -> None:
+    """Test the written JSON keeps the two-space indented array layout."""
     override_rules = [
         OverrideRule(
             override_type=OverrideType.REMOVE,
-            target={OverrideTargetField.ORIGIN: ("https://github.com/test/remove")},
+            target={OverrideTargetField.ORIGIN: "https://github.com/test/remove"},
             replacement=None,
         )
     ]
 
-    json_writer = JSONOverridesWriter()
-    result = json_writer.write(override_rules)
-
-    assert isinstance(result, str)
-    json_content = json.loads(result)
-
-    assert len(json_content) == 1
-    assert json_content[0]["override_type"] == "remove"
-    assert json_content[0]["target"]["origin"] == "https://github.com/test/remove"
-    assert json_content[0]["replacement"] is None
-
-
-def test_json_overrides_writer_writes_add_rule() -> None:
-    """Test writing an ADD override rule returns JSON string."""
-    override_rules = [
-        OverrideRule(
-            override_type=OverrideType.ADD,
-            target={OverrideTargetField.COMPONENT: "new-component"},
-            replacement=Metadata(
-                name="new-component",
-                version=None,
-                origin="https://github.com/new/component",  # noqa: E501
-                local_src_path=None,
-                license=["BSD-3-Clause"],
-                copyright=["New Author"],
-            ),
-        )
-    ]
-
-    json_writer = JSONOverridesWriter()
-    result = json_writer.write(override_rules)
-
-    assert isinstance(result, str)
-    json_content = json.loads(result)
-
-    assert len(json_content) == 1
-    assert json_content[0]["override_type"] == "add"
-    assert json_content[0]["target"]["component"] == "new-component"
-    assert json_content[0]["replacement"]["name"] == "new-component"
-    assert json_content[0]["replacement"]["license"] == ["BSD-3-Clause"]
+    result = JSONOverridesWriter().write(override_rules)
+
+    assert result == (
+        "[\n"
+        "  {\n"
+        '    "override_type": "remove",\n'
+        '    "target": {\n'
+        '      "origin": "https://github.com/test/remove"\n'
+        "    },\n"
+        '    "replacement": null\n'
+        "  }\n"
+        "]"
+    )
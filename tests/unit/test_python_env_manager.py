@@ -83,9 +83,6 @@ def test_python_env_is_created_if_python_project_detected_and_not_cached(
         side_effect=[["test.py", py_file], []],
     )
 
-    chdir_mock = mocker.patch(
-        "dd_license_attribution.artifact_management.python_env_manager.change_directory"
-    )
     run_command_mock = mocker.patch(
         "dd_license_attribution.artifact_management.python_env_manager.run_command",
         return_value=0,
@@ -104,7 +101,6 @@ def test_python_env_is_created_if_python_project_detected_and_not_cached(
     artifact_path_exists_mock.assert_called_once_with("cache_dir")
     artifact_list_dir_mock.assert_called_once_with("cache_dir")
     python_env_list_dir_mock.assert_has_calls([call(resource_path), call("cache_dir")])
-    chdir_mock.assert_has_calls([call(resource_path), call(resource_path)])
     run_command_mock.assert_has_calls(
         [
             mocker.call(
@@ -113,7 +109,8 @@ def test_python_env_is_created_if_python_project_detected_and_not_cached(
                     "-m",
                     "venv",
                     "cache_dir/20220101_000000Z/cache_dir_20210901_000000Z_python_project_virtualenv",
-                ]
+                ],
+                cwd=resource_path,
             ),
             mocker.call(
                 [
@@ -122,7 +119,8 @@ def test_python_env_is_created_if_python_project_detected_and_not_cached(
                     "pip",
                     "install",
                     ".",
-                ]
+                ],
+                cwd=resource_path,
             ),
         ]
     )
@@ -153,9 +151,6 @@ def test_python_env_is_returned_if_python_project_detected_and_cached(
         "dd_license_attribution.artifact_management.python_env_manager.path_exists",
         return_value=True,
     )
-    chdir_mock = mocker.patch(
-        "dd_license_attribution.artifact_management.python_env_manager.change_directory"
-    )
     run_command_mock = mocker.patch(
         "dd_license_attribution.artifact_management.python_env_manager.run_command",
         return_value=0,
@@ -174,7 +169,6 @@ def test_python_env_is_returned_if_python_project_detected_and_cached(
     python_env_path_exists_mock.assert_called_once_with(
         "cache_dir/20220101_000000Z/cache_dir_20210901_000000Z_python_project_virtualenv"
     )
-    chdir_mock.assert_called_once_with(resource_path)
     run_command_mock.assert_has_calls(
         [
             mocker.call(
@@ -184,7 +178,8 @@ def test_python_env_is_returned_if_python_project_detected_and_cached(
                     "pip",
                     "install",
                     ".",
-                ]
+                ],
+                cwd=resource_path,
             ),
         ]
     )
@@ -215,9 +210,6 @@ def test_python_env_is_created_if_python_project_detected_and_force_update(
         "dd_license_attribution.artifact_management.python_env_manager.path_exists",
         return_value=True,
     )
-    chdir_mock = mocker.patch(
-        "dd_license_attribution.artifact_management.python_env_manager.change_directory"
-    )
     run_command_mock = mocker.patch(
         "dd_license_attribution.artifact_management.python_env_manager.run_command",
         return_value=0,
@@ -237,7 +229,6 @@ def test_python_env_is_created_if_python_project_detected_and_force_update(
     python_env_path_exists_mock.assert_called_once_with(
         "cache_dir/20220101_000000Z/cache_dir_20210901_000000Z_python_project_virtualenv"
     )
-    chdir_mock.assert_has_calls([call(resource_path), call(resource_path)])
     run_command_mock.assert_has_calls(
         [
             mocker.call(
@@ -246,7 +237,8 @@ def test_python_env_is_created_if_python_project_detected_and_force_update(
                     "-m",
                     "venv",
                     "cache_dir/20220101_100000Z/cache_dir_20210901_000000Z_python_project_virtualenv",
-                ]
+                ],
+                cwd=resource_path,
             ),
             mocker.call(
                 [
@@ -255,7 +247,8 @@ def test_python_env_is_created_if_python_project_detected_and_force_update(
                     "pip",
                     "install",
                     ".",
-                ]
+                ],
+                cwd=resource_path,
             ),
         ]
     )
@@ -300,9 +293,6 @@ def test_fail_to_create_pyenv_throws(mocker: MockFixture) -> None:
         side_effect=[["setup.py", "requirements.txt"], []],
     )
 
-    chdir_mock = mocker.patch(
-        "dd_license_attribution.artifact_management.python_env_manager.change_directory"
-    )
     run_command_mock = mocker.patch(
         "dd_license_attribution.artifact_management.python_env_manager.run_command"
     )
@@ -318,14 +308,14 @@ def test_fail_to_create_pyenv_throws(mocker: MockFixture) -> None:
     artifact_path_exists_mock.assert_called_once_with("cache_dir")
     artifact_list_dir_mock.assert_called_once_with("cache_dir")
     python_env_list_dir_mock.assert_has_calls([call(resource_path), call("cache_dir")])
-    chdir_mock.assert_called_once_with(resource_path)
     run_command_mock.assert_called_once_with(
         [
             "python",
             "-m",
             "venv",
             "cache_dir/20220101_000000Z/cache_dir_20210901_000000Z_python_project_virtualenv",
-        ]
+        ],
+        cwd=resource_path,
     )
 
 
@@ -349,9 +339,6 @@ def test_fail_to_install_dependencies_in_pyenv_throws(mocker: MockFixture) -> No
         side_effect=[["setup.py", "requirements.txt"], []],
     )
 
-    chdir_mock = mocker.patch(
-        "dd_license_attribution.artifact_management.python_env_manager.change_directory"
-    )
     run_command_mock = mocker.patch(
         "dd_license_attribution.artifact_management.python_env_manager.run_command"
     )
@@ -370,7 +357,6 @@ def test_fail_to_install_dependencies_in_pyenv_throws(mocker: MockFixture) -> No
     artifact_path_exists_mock.assert_called_once_with("cache_dir")
     artifact_list_dir_mock.assert_called_once_with("cache_dir")
     python_env_list_dir_mock.assert_has_calls([call(resource_path), call("cache_dir")])
-    chdir_mock.assert_has_calls([call(resource_path), call(resource_path)])
     run_command_mock.assert_has_calls(
         [
             mocker.call(
@@ -379,7 +365,8 @@ def test_fail_to_install_dependencies_in_pyenv_throws(mocker: MockFixture) -> No
                     "-m",
                     "venv",
                     "cache_dir/20220101_000000Z/cache_dir_20210901_000000Z_python_project_virtualenv",
-                ]
+                ],
+                cwd=resource_path,
             ),
             mocker.call(
                 [
@@ -388,7 +375,8 @@ def test_fail_to_install_dependencies_in_pyenv_throws(mocker: MockFixture) -> No
                     "pip",
                     "install",
                     ".",
-                ]
+                ],
+                cwd=resource_path,
             ),
         ]
     )
@@ -335,6 +335,78 @@ def test_source_code_manager_get_cached_code(
     run_command_mock.assert_not_called()
 
 
+@patch(
+    "dd_license_attribution.artifact_management.source_code_manager.output_from_command"
+)
+@patch("dd_license_attribution.artifact_management.source_code_manager.run_command")
+@patch("dd_license_attribution.artifact_management.source_code_manager.list_dir")
+@patch("dd_license_attribution.artifact_management.artifact_manager.list_dir")
+@patch("dd_license_attribution.artifact_management.source_code_manager.path_exists")
+@patch("dd_license_attribution.artifact_management.artifact_manager.path_exists")
+@patch("dd_license_attribution.artifact_management.source_code_manager.parse_git_url")
+@patch("dd_license_attribution.artifact_management.artifact_manager.get_datetime_now")
+def test_source_code_manager_reuses_code_reference_for_repeated_url(
+    get_datetime_now_mock: Mock,
+    git_url_parse_mock: Mock,
+    path_exists_mock: Mock,
+    path_exists_source_code_mock: Mock,
+    artifact_list_dir_mock: Mock,
+    source_code_list_dir_mock: Mock,
+    run_command_mock: Mock,
+    output_from_command_mock: Mock,
+) -> None:
+    request_url = "https://github.com/test_owner/test_repo/tree/test_branch/test_dir"
+
+    # Configure mocks
+    get_datetime_now_mock.return_value = datetime.fromisoformat(
+        "2022-01-01T00:00:00+00:00"
+    )
+    github_client_mock = create_github_client_mock()
+    git_url_parse_mock.return_value = GitUrlParseMock(
+        valid=True,
+        owner="test_owner",
+        repo="test_repo",
+        branch="test_branch",
+        path="test_dir",
+        path_raw="/tree/test_branch/test_dir",
+    )
+    path_exists_mock.return_value = True
+    path_exists_source_code_mock.return_value = True
+    artifact_list_dir_mock.return_value = ["20211231_001000Z"]
+    source_code_list_dir_mock.return_value = ["20211231_001000Z"]
+    output_from_command_mock.return_value = (
+        "72a11341aa684010caf1ca5dee779f0e7e84dfe9\trefs/heads/test_branch\n"
+    )
+
+    source_code_manager = SourceCodeManager("cache_dir", github_client_mock, 86400)
+    first_code_ref = source_code_manager.get_code(request_url)
+    second_code_ref = source_code_manager.get_code(request_url)
+
+    assert first_code_ref == SourceCodeReference(
+        repo_url="https://github.com/test_owner/test_repo",
+        branch="test_branch",
+        local_root_path="cache_dir/20211231_001000Z/test_owner-test_repo/test_branch",
+        local_full_path="cache_dir/20211231_001000Z/test_owner-test_repo/test_branch/test_dir",
+    )
+    assert second_code_ref is first_code_ref
+    assert (
+        git_url_parse_mock.call_count == 3
+    )  # Only the first get_code call parses the URL
+    source_code_list_dir_mock.assert_called_once_with("cache_dir")
+    path_exists_source_code_mock.assert_called_once_with(
+        "cache_dir/20211231_001000Z/test_owner-test_repo/test_branch"
+    )
+    output_from_command_mock.assert_called_once_with(
+        [
+            "git",
+            "ls-remote",
+            "https://github.com/test_owner/test_repo",
+            "test_branch",
+        ]
+    )
+    run_command_mock.assert_not_called()
+
+
 @patch(
     "dd_license_attribution.artifact_management.source_code_manager.output_from_command"
 )